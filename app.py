@@ -1,18 +1,20 @@
 import streamlit as st
 import os
 import sys
+import time
 from datetime import datetime
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
+import altair as alt
 import json
-import io
-import base64
-import networkx as nx
-from langdetect import detect, DetectorFactory
-import aiohttp
+import re
+from collections import Counter, deque, namedtuple
+from dataclasses import dataclass, field
+from statistics import fmean
+from functools import lru_cache, singledispatch
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 
 
 
@@ -24,7 +26,7 @@ try:
     from utils.resume_parser import ResumeParser
     from utils.question_gen import QuestionGenerator
     from utils.ai_enhancer import AIEnhancer
-    from utils.bias_detector import detect_bias_in_text, analyze_question_fairness, generate_bias_report
+    from utils.bias_detector import detect_bias_in_text, question_fairness_verdict, generate_bias_report
     from utils.resume_parser import build_skills_graph, get_skills_by_category, calculate_skill_metrics
     from utils.visualizer import create_skills_network, plot_skill_categories, create_category_barchart, create_confidence_heatmap
     from utils.bias_heatmap import BiasHeatmapGenerator, bias_heatmap
@@ -34,17 +36,15 @@ try:
     # NEW: Import analytics engine
     from utils.analytics_engine import AnalyticsEngine
     # NEW: Import language support
-    from utils.language_support import language_support
-    # NEW: Import audio/video processor
-    from utils.audio_video_processor import AudioVideoProcessor, RealtimeAudioVideoProcessor, av_processor, realtime_av_processor
+    from utils.language_support import language_support, translate_ui_text
 except ImportError as e:
     st.error(f"Some modules not found: {e}")
     
     # Fallback implementations (keeping your existing fallbacks)
     class ResumeParser:
-        def extract_skills(self, text):
+        def extract_skills(self, text, text_lower=None):
             return [("python", "technical", 0.8), ("communication", "soft", 0.7)]
-        def parse_experience(self, text):
+        def parse_experience(self, text, text_lower=None):
             return "Mid"
     
     class QuestionGenerator:
@@ -169,56 +169,18 @@ except ImportError as e:
         def adapt_question_for_language(self, question, target_language, original_language='English'):
             return question
     
-    # Audio/Video processor fallback
-    class AudioVideoProcessor:
-        def __init__(self):
-            self.is_recording = False
-        
-        def record_audio_video(self, duration=30):
-            st.error("Audio/Video recording not available in fallback mode")
-            return None, None
-        
-        def speech_to_text(self, audio_path):
-            return "Audio transcription not available", False
-        
-        def analyze_speech_patterns(self, audio_path):
-            return {'success': False, 'error': 'Audio processing not available'}
-        
-        def analyze_video_feed(self, video_path):
-            return {'success': False, 'error': 'Video processing not available'}
-    
-    class RealtimeAudioVideoProcessor:
-        def __init__(self):
-            self.is_recording = False
-        
-        def start_realtime_recording(self, duration=30):
-            st.error("Real-time audio/video recording not available in fallback mode")
-            return "", None, None
-        
-        def analyze_speech_patterns(self, audio_path):
-            return {'success': False, 'error': 'Audio processing not available'}
-        
-        def analyze_video_feed(self, video_path):
-            return {'success': False, 'error': 'Video processing not available'}
-    
     bias_heatmap = BiasHeatmapGenerator()
     difficulty_manager = DifficultyManager()
     heatmap_generator = HeatmapGenerator()
     analytics_engine = AnalyticsEngine()
     language_support = LanguageSupport()
-    av_processor = AudioVideoProcessor()
-    realtime_av_processor = RealtimeAudioVideoProcessor()
+    translate_ui_text = language_support.translate_ui_text
     
     def detect_bias_in_text(text): 
         return {"bias_types": [], "severity": "Low", "confidence": 0.0}
     
-    def analyze_question_fairness(question):
-        return {
-            "question": question,
-            "bias_analysis": {"bias_types": [], "severity": "None"},
-            "risk_level": "Low",
-            "suggestion": "No issues detected"
-        }
+    def question_fairness_verdict(question):
+        return ("Low", "No issues detected")
     
     def generate_bias_report(interview_data):
         return {
@@ -249,165 +211,907 @@ except ImportError as e:
     def create_confidence_heatmap(skills_graph):
         return create_simple_heatmap(skills_graph)
     
-    # Helper functions for fallback visualizations
+    # Helper functions for fallback visualizations. These return Altair
+    # (Vega-Lite) charts rather than Plotly figures: the spec is far smaller
+    # and Streamlit already ships the renderer.
+    def _fallback_confidences(skills_graph):
+        """Return (skills, confidences) from a dictionary skills graph"""
+        df = _skills_frame(skills_graph)
+        return df["skill"].to_numpy(), df["confidence"].to_numpy()
+    
+    def _fallback_category_counts(skills_data):
+        """Return a category/count DataFrame for the category fallbacks"""
+        if skills_data and isinstance(skills_data, dict):
+            return pd.DataFrame({
+                "category": list(skills_data.keys()),
+                "count": [len(skills) for skills in skills_data.values()]
+            })
+        return pd.DataFrame({"category": ['Technical', 'Soft'], "count": [3, 2]})
+    
     def create_simple_skills_chart(skills_graph):
         """Create a simple skills chart that works with dictionary data"""
-        fig = go.Figure()
-        
         if skills_graph and isinstance(skills_graph, dict):
-            # Extract skills from the graph
-            skills = list(skills_graph.keys())
-            confidences = []
-            
-            for skill_name, skill_data in skills_graph.items():
-                if hasattr(skill_data, 'confidence'):
-                    confidences.append(skill_data.confidence)
-                elif isinstance(skill_data, dict) and 'confidence' in skill_data:
-                    confidences.append(skill_data['confidence'])
-                else:
-                    confidences.append(0.7)  # Default confidence
-            
-            fig.add_trace(go.Bar(
-                x=skills,
-                y=confidences,
-                marker_color='lightblue'
-            ))
+            skills, confidences = _fallback_confidences(skills_graph)
+            color = 'lightblue'
         else:
             # Fallback with sample data
-            fig.add_trace(go.Bar(
-                x=['Python', 'Communication', 'Teamwork'],
-                y=[0.8, 0.7, 0.6],
-                marker_color='lightgreen'
-            ))
-        
-        fig.update_layout(
-            title="Skills Confidence Levels",
-            xaxis_title="Skills",
-            yaxis_title="Confidence Level",
-            height=400
+            skills, confidences = ['Python', 'Communication', 'Teamwork'], [0.8, 0.7, 0.6]
+            color = 'lightgreen'
+        
+        df = pd.DataFrame({"skill": skills, "confidence": confidences})
+        return alt.Chart(df, title="Skills Confidence Levels", height=400).mark_bar(color=color).encode(
+            x=alt.X("skill:N", title="Skills", sort=None),
+            y=alt.Y("confidence:Q", title="Confidence Level"),
+            tooltip=["skill", "confidence"]
         )
-        return fig
     
     def create_simple_category_chart(skills_data):
         """Create a simple category chart"""
-        fig = go.Figure()
-        
-        if skills_data and isinstance(skills_data, dict):
-            categories = list(skills_data.keys())
-            counts = [len(skills) for skills in skills_data.values()]
-            
-            fig.add_trace(go.Pie(
-                labels=categories,
-                values=counts,
-                hole=0.3
-            ))
-        else:
-            fig.add_trace(go.Pie(
-                labels=['Technical', 'Soft'],
-                values=[3, 2],
-                hole=0.3
-            ))
-        
-        fig.update_layout(
-            title="Skills by Category",
-            height=400
+        df = _fallback_category_counts(skills_data)
+        return alt.Chart(df, title="Skills by Category", height=400).mark_arc(innerRadius=50).encode(
+            theta="count:Q",
+            color="category:N",
+            tooltip=["category", "count"]
         )
-        return fig
     
     def create_simple_barchart(skills_data):
         """Create a simple bar chart"""
-        fig = go.Figure()
-        
-        if skills_data and isinstance(skills_data, dict):
-            categories = list(skills_data.keys())
-            counts = [len(skills) for skills in skills_data.values()]
-            
-            fig.add_trace(go.Bar(
-                x=categories,
-                y=counts,
-                marker_color='coral'
-            ))
-        else:
-            fig.add_trace(go.Bar(
-                x=['Technical', 'Soft'],
-                y=[3, 2],
-                marker_color='coral'
-            ))
-        
-        fig.update_layout(
-            title="Skills Distribution by Category",
-            xaxis_title="Category",
-            yaxis_title="Number of Skills",
-            height=400
+        df = _fallback_category_counts(skills_data)
+        return alt.Chart(df, title="Skills Distribution by Category", height=400).mark_bar(color='coral').encode(
+            x=alt.X("category:N", title="Category", sort=None),
+            y=alt.Y("count:Q", title="Number of Skills"),
+            tooltip=["category", "count"]
         )
-        return fig
     
     def create_simple_heatmap(skills_graph):
         """Create a simple heatmap"""
-        fig = go.Figure()
-        
         if skills_graph and isinstance(skills_graph, dict):
-            skills = list(skills_graph.keys())
-            confidences = []
-            
-            for skill_name, skill_data in skills_graph.items():
-                if hasattr(skill_data, 'confidence'):
-                    confidences.append([skill_data.confidence])
-                elif isinstance(skill_data, dict) and 'confidence' in skill_data:
-                    confidences.append([skill_data['confidence']])
-                else:
-                    confidences.append([0.7])
-            
-            fig.add_trace(go.Heatmap(
-                z=confidences,
-                x=['Confidence'],
-                y=skills,
-                colorscale='Viridis'
-            ))
+            skills, confidences = _fallback_confidences(skills_graph)
         else:
-            fig.add_trace(go.Heatmap(
-                z=[[0.8], [0.7], [0.6]],
-                x=['Confidence'],
-                y=['Python', 'Communication', 'Teamwork'],
-                colorscale='Viridis'
-            ))
-        
-        fig.update_layout(
-            title="Skills Confidence Heatmap",
-            height=400
+            skills, confidences = ['Python', 'Communication', 'Teamwork'], [0.8, 0.7, 0.6]
+        
+        df = pd.DataFrame({"skill": skills, "metric": "Confidence", "confidence": confidences})
+        return alt.Chart(df, title="Skills Confidence Heatmap", height=400).mark_rect().encode(
+            x=alt.X("metric:N", title=None),
+            y=alt.Y("skill:N", title=None, sort=None),
+            color=alt.Color("confidence:Q", scale=alt.Scale(scheme="viridis")),
+            tooltip=["skill", "confidence"]
         )
-        return fig
+
+# Enhanced CSS for dark/light theme compatibility lives in static/style.css.
+# It is read and minified once per server process; the <style> element is still
+# emitted on every run because Streamlit drops elements a rerun does not repeat.
+_CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "style.css")
+
+@st.cache_resource(show_spinner=False)
+def _load_css():
+    """Read and minify the page stylesheet into a <style> block"""
+    with open(_CSS_PATH, encoding="utf-8") as css_file:
+        css = css_file.read()
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s*([{}:;,])\s*", r"\1", re.sub(r"\s+", " ", css)).strip()
+    return f"<style>{css}</style>"
+
+@lru_cache(maxsize=None)
+def _get_px():
+    """Import plotly.express on first use (only two analytics charts need it)"""
+    import plotly.express as px
+    return px
+
+# The audio/video stack (SpeechRecognition, OpenCV, sounddevice) is heavy and only
+# needed once recording is enabled, so it is imported on first use. The processors
+# hold device state, so they are shared resources like the other heavy components
+@st.cache_resource(show_spinner=False)
+def _get_av_processors():
+    """Return (av_processor, realtime_av_processor), falling back to stubs if unavailable"""
+    try:
+        from utils.audio_video_processor import av_processor, realtime_av_processor
+        return av_processor, realtime_av_processor
+    except (ImportError, OSError) as e:
+        print(f"Audio/video modules not available: {e}")
+    
+        # Audio/Video processor fallback
+        class AudioVideoProcessor:
+            def __init__(self):
+                self.is_recording = False
+        
+            def record_audio_video(self, duration=30):
+                st.error("Audio/Video recording not available in fallback mode")
+                return None, None
+        
+            def speech_to_text(self, audio_path):
+                return "Audio transcription not available", False
+        
+            def analyze_speech_patterns(self, audio_path):
+                return {'success': False, 'error': 'Audio processing not available'}
+        
+            def analyze_video_feed(self, video_path):
+                return {'success': False, 'error': 'Video processing not available'}
+    
+        class RealtimeAudioVideoProcessor:
+            def __init__(self):
+                self.is_recording = False
+        
+            def start_realtime_recording(self, duration=30):
+                st.error("Real-time audio/video recording not available in fallback mode")
+                return "", None, None
+        
+            def analyze_speech_patterns(self, audio_path):
+                return {'success': False, 'error': 'Audio processing not available'}
+        
+            def analyze_video_feed(self, video_path):
+                return {'success': False, 'error': 'Video processing not available'}
+    
+    return AudioVideoProcessor(), RealtimeAudioVideoProcessor()
+
+@dataclass(slots=True)
+class SkillNode:
+    """Skills-graph node used when the parser's graph has to be rebuilt or replaced"""
+    skill: str
+    category: str
+    confidence: float
+    frequency: int = 1
+    related_skills: list = field(default_factory=list)
+
+@singledispatch
+def _normalize_node(skill_data, skill_name):
+    """Return a node with the attributes the visualizer expects"""
+    if hasattr(skill_data, '__dict__'):
+        # It's already an object with attributes
+        return skill_data
+    return SkillNode(skill_name, 'technical', 0.7)
+
+@_normalize_node.register
+def _(skill_data: SkillNode, skill_name):
+    return skill_data
+
+@_normalize_node.register
+def _(skill_data: dict, skill_name):
+    # Create a node with the expected attributes
+    return SkillNode(
+        skill_name,
+        skill_data.get('category', 'technical'),
+        skill_data.get('confidence', 0.7),
+        skill_data.get('frequency', 1),
+        skill_data.get('related_skills', []),
+    )
+
+# One interview question with everything recorded against it, kept in
+# st.session_state.qna_rows so review loops walk a single list
+QnARow = namedtuple('QnARow', 'question answer bias analysis follow_up')
+
+# Skill chip templates - bound str.format so display loops only substitute the name.
+# Sections join all chips into one string and emit a single st.markdown delta.
+_CHIP_TECH = '<span class="skill-chip skill-chip-technical">⚡ {}</span>'.format
+_CHIP_SOFT = '<span class="skill-chip skill-chip-soft">🌟 {}</span>'.format
+_CHIP_PLAIN = '<span class="skill-chip">🎯 {}</span>'.format
+
+# Experience level badges shown next to the discovered skills
+_LEVEL_EMOJIS = {'Entry': '🟢', 'Mid': '🟡', 'Senior': '🔴'}
+
+# Recruiter dashboard metric card - bound str.format, filled once per card
+_RECRUITER_CARD = """
+<div class="recruiter-metric-card{cls}">
+    <h3>{icon} {title}</h3>
+    <h1>{value}%</h1>
+    <p>{caption}</p>
+</div>
+""".format
+
+# Answer quality difficulty zones (level, low, high, color) as plain layout dicts,
+# the same bands add_hrect would draw across the full plot width
+_DIFFICULTY_ZONES = (
+    ('Easy', 0, 4, 'rgba(40, 167, 69, 0.1)'),
+    ('Medium', 4, 7, 'rgba(255, 193, 7, 0.1)'),
+    ('Hard', 7, 9, 'rgba(253, 126, 20, 0.1)'),
+    ('Expert', 9, 11, 'rgba(220, 53, 69, 0.1)'),
+)
+_DIFFICULTY_ZONE_SHAPES = [
+    dict(type='rect', xref='x domain', yref='y', x0=0, x1=1, y0=low, y1=high,
+         fillcolor=color, opacity=0.3, line=dict(width=0))
+    for _, low, high, color in _DIFFICULTY_ZONES
+]
+_DIFFICULTY_ZONE_ANNOTATIONS = [
+    dict(xref='x domain', yref='y', x=0, y=high, text=level, showarrow=False,
+         xanchor='left', yanchor='top')
+    for level, _, high, _ in _DIFFICULTY_ZONES
+]
+
+# Fairness dashboard summary card - bound str.format, filled once per card
+_SUMMARY_CARD = """
+<div class="summary-card" style="background: linear-gradient(135deg, {start} 0%, {end} 100%);">
+    <h3>{icon} {title}</h3>
+    <h2>{value}</h2>
+    <p>{caption}</p>
+</div>
+""".format
+
+# Interview section blocks - bound str.format, so a rerun only substitutes values
+_LANGUAGE_BANNER = """
+<div class="language-selector">
+    🌍 <strong>{label}:</strong> {language} 
+    | 💬 <strong>You can answer in any language</strong>
+</div>
+""".format
+
+_BIAS_ALERT_BANNER = """
+<div class="bias-alert-box">
+    <strong>🚨 {label}:</strong> {count} potential bias(es) detected so far
+</div>
+""".format
+
+_PROGRESS_TEXT = """
+<div class='progress-text'>
+📍 Question {number} of {total} 
+({percent}% Complete)
+<br>📊 {difficulty_label}: <strong>{difficulty}</strong>
+<br>🌐 {language_label}: <strong>{language}</strong>
+</div>
+""".format
+
+_AI_ENHANCED_QUESTION = """
+<div class="ai-enhanced-box">
+    <strong style='color: #FFD700;'>🤖 {label}:</strong><br>
+    {question}
+    <br><br>
+    <small><em>💡 {explanation}</em></small>
+</div>
+""".format
+
+_QUESTION_BOX = """
+<div class="question-box">
+    <strong style='color: #4FC3F7;'>💡 {label}:</strong><br>
+    {question}
+</div>
+""".format
+
+_AI_ANALYSIS_BOX = """
+<div class="ai-analysis-box">
+    <strong>🤖 {label}:</strong><br>
+    <strong>{score_label}:</strong> {score}/10<br>
+    <strong>{strengths_label}:</strong> {strengths}<br>
+    <strong>{skills_label}:</strong> {skills}
+</div>
+""".format
+
+# Bias alert levels as (level, display color), and their base fairness scores
+_BIAS_ALERT_HIGH = ("High", "#dc3545")
+_BIAS_ALERT_MEDIUM = ("Medium", "#ffc107")
+_BIAS_ALERT_LOW = ("Low", "#28a745")
+_BIAS_SCORES = {"Low": 9, "Medium": 6, "High": 3}
+
+# Typical job requirements used by the skills match score (lowercase, hashed lookup)
+_TARGET_TECH = frozenset({'python', 'java', 'javascript', 'sql', 'html', 'css', 'react', 'node.js'})
+_TARGET_SOFT = frozenset({'communication', 'teamwork', 'leadership', 'problem solving', 'creativity'})
+
+# Heavy components are stateless once constructed (AIEnhancer probes Ollama in
+# its constructor), so build them once per server process rather than per rerun
+@st.cache_resource(show_spinner=False)
+def _get_parser():
+    """Shared resume parser"""
+    return ResumeParser()
+
+@st.cache_resource(show_spinner=False)
+def _get_question_generator():
+    """Shared question generator"""
+    return QuestionGenerator()
+
+@st.cache_resource(show_spinner=False)
+def _get_ai_enhancer():
+    """Shared AI enhancer (Ollama availability is checked once)"""
+    return AIEnhancer()
+
+@st.cache_resource(show_spinner=False)
+def _get_analytics_engine():
+    """Shared analytics engine"""
+    return AnalyticsEngine()
+
+# Resume analysis is a pure function of the resume text, so re-analysing the same
+# (or a partially edited) resume is served from cache. Only picklable data is
+# cached - SkillNode conversion stays in FairAIHireApp.analyze_resume.
+@st.cache_data(show_spinner=False)
+def _detect_language_cached(text):
+    """Detect the resume language"""
+    return language_support.detect_language(text)
+
+def _category_stats(skills_result):
+    """Per-category skill counts and mean confidence from (skill, category, confidence) tuples"""
+    if not skills_result:
+        return {}, {}
+    _, categories, confidences = zip(*skills_result)
+    # factorize keeps first-seen category order, which the charts rely on
+    codes, labels = pd.factorize(pd.Series(categories, dtype=object))
+    counts = np.bincount(codes, minlength=len(labels))
+    sums = np.bincount(codes, weights=np.asarray(confidences, dtype=float), minlength=len(labels))
+    return (dict(zip(labels, counts.tolist())),
+            dict(zip(labels, (sums / counts).tolist())))
+
+@st.cache_data(show_spinner=False)
+def _analyze_resume_cached(resume_text):
+    """Extract skills, experience level and the skills graph from resume text"""
+    parser = _get_parser()
+    # Lowercase once and extract skills once; the graph reuses the extracted skills
+    text_lower = resume_text.lower()
+    skills_result = parser.extract_skills(resume_text, text_lower=text_lower)
+    skills_graph = build_skills_graph(resume_text, skills_result)
+    
+    category_counts, category_confidence = _category_stats(skills_result)
+    
+    skills_data = None
+    if (skills_graph and isinstance(skills_graph, dict) and
+            all(isinstance(v, dict) and 'confidence' in v for v in skills_graph.values())):
+        skills_data = get_skills_by_category(skills_graph)
+    
+    return {
+        'skills_result': skills_result,
+        'experience_level': parser.parse_experience(resume_text, text_lower=text_lower),
+        'skills_graph': skills_graph,
+        'skills_data': skills_data,
+        # Category -> number of skills / mean confidence, so charts never re-aggregate on rerun
+        'category_counts': category_counts,
+        'category_confidence': category_confidence,
+    }
+
+# Worker pool for independent blocking calls (the AI depth analysis runs here while
+# the follow-up question is generated). app.py is re-executed on every rerun, so the
+# pool is a cached resource rather than a module global that would leak a pool per run.
+# Workers must not touch st.* - everything they need is passed in.
+@st.cache_resource(show_spinner=False)
+def _get_executor():
+    """Shared thread pool for overlapping independent blocking calls"""
+    return ThreadPoolExecutor(max_workers=2)
+
+def _prepare_questions(question_gen, skills, experience, language):
+    """Generate, language-adapt and bias-check interview questions"""
+    questions = question_gen.generate_questions(skills, experience)
+    
+    # Adapt questions to selected language
+    adapt = language_support.adapt_question_for_language
+    adapted_questions = [adapt(question, language) for question in questions]
+    
+    # NEW: Check questions for potential bias before displaying
+    try:
+        # Verdicts are memoized per question in utils.bias_detector, across reruns and sessions
+        bias_checks = [question_fairness_verdict(question) for question in adapted_questions]
+    except Exception as e:
+        # If bias checking fails, log but continue with the questions anyway
+        print(f"Bias check warning: {str(e)}")
+        bias_checks = []
+    
+    return questions, adapted_questions, bias_checks
+
+# Canonical tabular form of the skills graph. Nodes may be SkillNode-like objects
+# or plain dicts; they are normalized once when the resume is analysed so charts,
+# tables and exports work on columns instead of re-inspecting every node.
+_SKILLS_DF_COLUMNS = ["skill", "category", "confidence", "frequency", "related_skills"]
+# Column layout of st.session_state.candidate_skills_df, one row per extracted (skill, category, confidence)
+_CANDIDATE_SKILLS_COLUMNS = ["skill", "category", "confidence"]
+
+def _dict_node_record(name, node):
+    """_SKILLS_DF_COLUMNS row for a dict skills-graph node"""
+    return (name, node.get('category', 'technical'), node.get('confidence', 0.7),
+            node.get('frequency', 1), list(node.get('related_skills') or []))
+
+def _attr_node_record(name, node):
+    """_SKILLS_DF_COLUMNS row for a SkillNode-like skills-graph node"""
+    return (name, getattr(node, 'category', 'technical'), getattr(node, 'confidence', 0.7),
+            getattr(node, 'frequency', 1), list(getattr(node, 'related_skills', None) or []))
+
+def _skills_frame(skills_graph):
+    """Normalize a skills graph into a DataFrame with _SKILLS_DF_COLUMNS"""
+    items = (skills_graph or {}).items()
+    records = []
+    if items:
+        # A graph holds one node type (parser dicts or fallback SkillNodes), so pick the reader once
+        first_node = next(iter(skills_graph.values()))
+        to_record = _dict_node_record if isinstance(first_node, dict) else _attr_node_record
+        records = [to_record(name, node) for name, node in items]
+    
+    df = pd.DataFrame.from_records(records, columns=_SKILLS_DF_COLUMNS)
+    return df.astype({"confidence": float, "frequency": int})
+
+# UI strings are static per (language, key), and a rerun looks up dozens of them.
+# The default language is read straight from its table; others go through the
+# process-wide translate_ui_text cache in utils.language_support
+_DEFAULT_LANGUAGE = 'English'
+_DEFAULT_STRINGS = getattr(language_support, 'translations', {}).get(_DEFAULT_LANGUAGE, {})
+
+# st.fragment (st.experimental_fragment before 1.37) reruns only the decorated
+# section on widget interaction; on older Streamlit the section runs as usual
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+# Button callbacks run only on a real click. st.rerun() in 1.28 keeps button triggers
+# set, so a button checked by its return value would fire again on the rerun
+def _request_recording():
+    """on_click for Start Recording"""
+    st.session_state.recording_requested = True
+
+def _show_chart(chart, key=None):
+    """Render an Altair chart (fallback visualizations) or a Plotly figure"""
+    if isinstance(chart, alt.TopLevelMixin):
+        st.altair_chart(chart, use_container_width=True)
+    else:
+        st.plotly_chart(chart, use_container_width=True, key=key)
+
+# Fairness metrics - the skills score is computed once per resume by
+# _rebuild_skill_index; the others are arithmetic on counters kept in session
+# state, cheaper to recompute than to hash for st.cache_data
+def _skills_match_score(candidate_tech_skills, candidate_soft_skills):
+    """Score technical/soft skill names against typical job requirements (0-100)"""
+    if not candidate_tech_skills and not candidate_soft_skills:
+        return 0
+    
+    # Set intersection runs in C and counts each target skill once, even when the
+    # resume lists it twice with different casing
+    tech_match = len(_TARGET_TECH.intersection(candidate_tech_skills))
+    soft_match = len(_TARGET_SOFT.intersection(candidate_soft_skills))
+    
+    tech_score = (tech_match / len(_TARGET_TECH)) * 70 if _TARGET_TECH else 0
+    soft_score = (soft_match / len(_TARGET_SOFT)) * 30 if _TARGET_SOFT else 0
+    
+    return min(100, int(tech_score + soft_score))
+
+# Reads the running severity counts kept by submit_answer, so it never walks the reports
+def _bias_alert_level(high_count, medium_count):
+    """Map bias severity counts to an alert level and display color"""
+    if high_count:
+        return _BIAS_ALERT_HIGH
+    
+    if medium_count > 1:
+        return _BIAS_ALERT_MEDIUM
+    else:
+        return _BIAS_ALERT_LOW
+
+def _interview_completeness(answered, total):
+    """Percentage of questions with a non-blank answer"""
+    if not total:
+        return 0
+    
+    return int((answered / total) * 100)
+
+def _overall_fairness_score(bias_alert_level, completeness):
+    """Combine bias alert level and completeness into a 1-10 fairness score"""
+    base_score = _BIAS_SCORES.get(bias_alert_level, 5)
+    
+    completeness_factor = completeness / 100.0
+    
+    return min(10, int(base_score + (completeness_factor * 2)))
+
+# Cached bias charts - figure construction is the costliest part of the fairness
+# dashboard, so reruns with unchanged interview data reuse the previous figure.
+# The generator is underscore-prefixed so Streamlit does not hash it.
+@st.cache_data(show_spinner=False)
+def _bias_heatmap_figure(_generator, interview_data):
+    """Build (and cache) the real-time bias heatmap for the given interview data"""
+    return _generator.generate_bias_heatmap(interview_data)
+
+# The bias report is shown on the dashboard and again in the fairness report, so
+# both read the same cached result until the interview data changes
+@st.cache_data(show_spinner=False)
+def _bias_report(interview_data):
+    """Cached generate_bias_report for the given interview data"""
+    return generate_bias_report(interview_data)
+
+@st.cache_data(show_spinner=False)
+def _bias_category_figure(_generator, category_items):
+    """Build (and cache) the bias category distribution from (category, count) pairs"""
+    return _generator.generate_category_distribution(dict(category_items))
+
+@st.cache_data(show_spinner=False)
+def _bias_timeline_figure(_generator, bias_history):
+    """Build (and cache) the bias detection timeline for the given history"""
+    return _generator.generate_timeline_heatmap(bias_history)
+
+@st.cache_data(show_spinner=False)
+def _bias_gauge_figure(_generator, bias_score):
+    """Build (and cache) the overall bias score gauge"""
+    return _generator.generate_severity_gauge(bias_score)
+
+@st.cache_data(show_spinner=False)
+def _score_progression_figure(scores):
+    """Build (and cache) the answer quality progression chart with difficulty zones"""
+    # numpy arrays go out through Plotly's typed-array encoding rather than a per-element JSON list
+    y = np.asarray(scores, dtype=float)
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        x=np.arange(1, y.size + 1),
+        y=y,
+        mode='lines+markers',
+        name='Answer Quality',
+        line=dict(color='#1f77b4', width=3),
+        marker=dict(size=8)
+    ))
+    
+    # Difficulty zones go in with the layout in one update instead of an add_hrect per zone
+    fig.update_layout(
+        title="Answer Quality Progression with Difficulty Zones",
+        xaxis_title="Question Number",
+        yaxis_title="Quality Score (1-10)",
+        height=400,
+        showlegend=False,
+        shapes=_DIFFICULTY_ZONE_SHAPES,
+        annotations=_DIFFICULTY_ZONE_ANNOTATIONS
+    )
+    return fig
+
+# Cached recruiter dashboard charts, keyed on the few numbers they plot
+@st.cache_data(show_spinner=False)
+def _skills_match_gauge(score, title):
+    """Build (and cache) the overall skills match gauge"""
+    fig = go.Figure(go.Indicator(
+        mode = "gauge+number+delta",
+        value = score,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': title},
+        gauge = {
+            'axis': {'range': [None, 100]},
+            'bar': {'color': "darkblue"},
+            'steps': [
+                {'range': [0, 50], 'color': "lightgray"},
+                {'range': [50, 80], 'color': "gray"},
+                {'range': [80, 100], 'color': "darkgray"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 90
+            }
+        }
+    ))
+    fig.update_layout(height=300)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _communication_metrics_bar(scores, title):
+    """Build (and cache) the communication metrics bar chart from (coherence, response time, length, confidence)"""
+    df = pd.DataFrame({
+        'Metric': ['Coherence', 'Response Time', 'Answer Length', 'Confidence'],
+        'Score': list(scores),
+        'Target': [70, 5, 50, 70]
+    })
+    return _get_px().bar(df, x='Metric', y='Score', title=title,
+                         color='Score', color_continuous_scale='Viridis')
+
+# Fairness report layout - parsed once at import and filled with str.format.
+# Optional lines (duration, hotspots, performance) carry their own trailing newline.
+_REPORT_RULE = "=" * 60
+_REPORT_HEADER = """{rule}
+           FAIRAI HIRE - FAIRNESS REPORT
+{rule}
+Generated: {generated}
+"""
+_REPORT_TEMPLATE = """SUMMARY METRICS:
+  • Skills Match Score: {skills_score}%
+  • Bias Alert Level: {bias_alert_level}
+  • Interview Completeness: {completeness}%
+  • Overall Fairness Score: {overall_score}/10
+  • Final Difficulty Level: {difficulty}
+{duration}  • Bias Detection Score: {bias_score}% ({grade})
+
+SKILLS ANALYSIS:
+{skills}
+
+BIAS ANALYSIS:
+{bias}
+{hotspots}
+PERFORMANCE ANALYSIS:
+{performance}
+RECOMMENDATIONS:
+{recommendations}
+
+{rule}
+           HIRING THAT SEES SKILLS, NOT DEMOGRAPHICS
+{rule}"""
+_DEFAULT_RECOMMENDATIONS = (
+    "Focus on job-relevant qualifications",
+    "Use standardized evaluation criteria",
+    "Avoid demographic-based assumptions",
+    "Implement structured interview processes",
+)
+
+@st.cache_data(show_spinner=False)
+def _build_fairness_report(interview_data, metrics, difficulty, duration, skills, bias_types,
+                           answer_scores, answered):
+    """Build the fairness report body (everything below the header) from hashable snapshots"""
+    # NEW: Generate comprehensive bias report
+    bias_report = _bias_report(interview_data)
+    skills_score, bias_alert_level, completeness, overall_score = metrics
+    
+    # Skills Analysis
+    if skills:
+        tech_skills, soft_skills = skills
+        skills_text = (f"  • Technical Skills: {', '.join(tech_skills) if tech_skills else 'None'}\n"
+                       f"  • Soft Skills: {', '.join(soft_skills) if soft_skills else 'None'}")
+    else:
+        skills_text = "  • No skills data available"
+    
+    # Bias Analysis
+    bias_text = "\n".join(
+        f"  • Question {i+1}: {', '.join(types)}" for i, types in enumerate(bias_types) if types
+    ) or "  • No biases detected - Excellent!"
+    
+    # Bias Hotspots
+    hotspots = bias_report.get('trend_analysis', {}).get('hotspots', [])
+    
+    # Performance Analysis
+    if answer_scores:
+        performance_text = (f"  • Average Answer Quality: {fmean(answer_scores):.1f}/10\n"
+                            f"  • Questions Answered: {answered}\n")
+    else:
+        performance_text = ""
+    
+    # Recommendations
+    recommendations = bias_report.get('recommendations', []) or _DEFAULT_RECOMMENDATIONS
+    
+    return _REPORT_TEMPLATE.format(
+        skills_score=skills_score,
+        bias_alert_level=bias_alert_level,
+        completeness=completeness,
+        overall_score=overall_score,
+        difficulty=difficulty,
+        duration=f"  • Interview Duration: {duration:.0f}s\n" if duration is not None else "",
+        bias_score=bias_report.get('overall_score', 100),
+        grade=bias_report.get('grade', 'A+'),
+        skills=skills_text,
+        bias=bias_text,
+        hotspots=f"  • Bias Hotspots: {', '.join(hotspots)}\n" if hotspots else "",
+        performance=performance_text,
+        recommendations="\n".join(f"  {i}. {rec}" for i, rec in enumerate(recommendations, 1)),
+        rule=_REPORT_RULE,
+    )
+
+# Recruiter metric cards - keyed on the values and the translated labels, so a
+# language switch builds a new row and other reruns reuse the cached HTML.
+# The cards sit in one CSS grid and go out as a single markdown element; no
+# blank lines, so the whole row stays one HTML block
+@st.cache_data(show_spinner=False)
+def _recruiter_cards(metrics):
+    """HTML for a row of (cls, icon, title, value, caption) recruiter metrics"""
+    return '<div class="recruiter-metric-grid">{}</div>'.format("".join(
+        _RECRUITER_CARD(cls=cls, icon=icon, title=title, value=value, caption=caption).strip()
+        for cls, icon, title, value, caption in metrics
+    ))
+
+# Fairness dashboard summary cards - same single-element grid as the recruiter row
+@st.cache_data(show_spinner=False)
+def _summary_cards(cards):
+    """HTML for a row of (start, end, icon, title, value, caption) summary cards"""
+    return '<div class="summary-card-grid">{}</div>'.format("".join(
+        _SUMMARY_CARD(start=start, end=end, icon=icon, title=title, value=value, caption=caption).strip()
+        for start, end, icon, title, value, caption in cards
+    ))
+
+# Analytics engine calls are pure functions of their inputs, so completing the
+# interview again or re-rendering the comparison tab reuses earlier results
+@st.cache_data(show_spinner=False)
+def _candidate_fit(_engine, skills_graph, job_requirements):
+    """Cached AnalyticsEngine.calculate_candidate_fit"""
+    return _engine.calculate_candidate_fit(skills_graph, job_requirements)
+
+@st.cache_data(show_spinner=False)
+def _communication_analysis(_engine, answer_texts, response_time=5):
+    """Cached AnalyticsEngine.analyze_communication_skills, keyed on the answer texts"""
+    # Answer records are only built on a cache miss
+    answers_data = [{'text': text, 'response_time': response_time} for text in answer_texts]
+    return _engine.analyze_communication_skills(answers_data)
+
+@st.cache_data(show_spinner=False)
+def _comparative_analytics(_engine, candidates_data):
+    """Cached AnalyticsEngine.generate_comparative_analytics"""
+    return _engine.generate_comparative_analytics(candidates_data)
+
+# Insights depend only on the analytics summary (bias count included), so they
+# are memoized like the report body below
+@st.cache_data(show_spinner=False)
+def _automated_insights(analytics_data):
+    """Generate automated insights based on analytics"""
+    insights = []
+    
+    skills_fit = analytics_data.get('skills_fit', {})
+    communication = analytics_data.get('communication_analysis', {})
+    hire_confidence = analytics_data.get('hire_confidence', 0)
+    
+    # Skills insights
+    if skills_fit.get('overall_score', 0) >= 80:
+        insights.append("🎯 Excellent skills match with job requirements")
+    elif skills_fit.get('overall_score', 0) >= 60:
+        insights.append("✅ Good skills alignment with some development areas")
+    else:
+        insights.append("📝 Significant skills gap identified - consider training")
+    
+    # Communication insights
+    if communication.get('coherence_score', 0) >= 70:
+        insights.append("💬 Strong communication skills demonstrated")
+    else:
+        insights.append("🗣️ Communication skills need improvement")
+    
+    # Bias insights
+    bias_count = analytics_data.get('bias_count', 0)
+    if bias_count == 0:
+        insights.append("⚖️ Low bias risk detected throughout interview")
+    else:
+        insights.append(f"⚠️ {bias_count} potential bias(es) identified")
+    
+    # Hire confidence insights
+    if hire_confidence >= 80:
+        insights.append("🏆 High hire confidence - strong candidate")
+    elif hire_confidence >= 60:
+        insights.append("👍 Moderate hire confidence - consider for next round")
+    else:
+        insights.append("🤔 Lower hire confidence - review carefully")
+    
+    return insights
+
+# Candidate analytics report body, filled in one pass. Each list entry carries
+# its own newline so empty sections keep the same spacing
+_ANALYTICS_REPORT_BODY = """EXECUTIVE SUMMARY:
+  • Overall Match Score: {overall_score}%
+  • Hire Confidence: {hire_confidence}%
+  • Communication Score: {coherence_score}%
+
+SKILLS ANALYSIS:
+  • Required Skills Score: {required_skills_score}%
+  • Preferred Skills Score: {preferred_skills_score}%
+  • Key Strengths: {strengths}
+  • Development Areas: {weaknesses}
+
+COMMUNICATION ANALYSIS:
+  • Coherence Score: {coherence_score}%
+  • Average Response Time: {avg_response_time}s
+  • Communication Style: {communication_style}
+  • Improvement Areas: {improvement_areas}
+
+RECOMMENDATIONS:
+{recommendations}
+AUTOMATED INSIGHTS:
+{insights}
+{rule}
+           DATA-DRIVEN HIRING DECISIONS
+{rule}""".format
+
+# analytics_data only changes when an interview is completed, so repeated
+# "Generate Report" clicks are served from cache
+@st.cache_data(show_spinner=False)
+def _build_analytics_report(analytics_data):
+    """Build the analytics report text after the header"""
+    skills_fit = analytics_data['skills_fit']
+    comm = analytics_data['communication_analysis']
+    return _ANALYTICS_REPORT_BODY(
+        overall_score=skills_fit.get('overall_score', 0),
+        hire_confidence=analytics_data.get('hire_confidence', 0),
+        coherence_score=comm.get('coherence_score', 0),
+        required_skills_score=skills_fit.get('required_skills_score', 0),
+        preferred_skills_score=skills_fit.get('preferred_skills_score', 0),
+        strengths=', '.join(skills_fit.get('strengths', [])),
+        weaknesses=', '.join(skills_fit.get('weaknesses', [])),
+        avg_response_time=comm.get('avg_response_time_seconds', 0),
+        communication_style=comm.get('communication_style', 'Unknown'),
+        improvement_areas=', '.join(comm.get('improvement_areas', [])),
+        recommendations="".join(f"  {i}. {rec}\n" for i, rec in
+                                enumerate(analytics_data.get('improvement_recommendations', []), 1)),
+        insights="".join(f"  • {insight}\n" for insight in analytics_data.get('summary_insights', [])),
+        rule="=" * 70,
+    )
+
+# Session state defaults. Immutable values are shared as-is; mutable ones are
+# built by a factory so no two sessions (or resets) share a list or dict.
+_DEFAULT_SESSION_STATE = {
+    'current_question_index': 0,
+    'candidate_experience': "Unknown",
+    'interview_started': False,
+    'interview_completed': False,
+    'resume_analyzed': False,
+    'ai_enabled': False,
+    # NEW: Add difficulty tracking and bias history
+    'current_difficulty': 'Medium',
+    # NEW: Language support
+    'selected_language': _DEFAULT_LANGUAGE,
+    'auto_detected_language': None,
+    'resume_language_detected': False,
+    # NEW: Audio/Video recording state
+    'audio_video_enabled': False,
+    'recording_in_progress': False,
+    # Set by the Start Recording button's callback, consumed by interview_section
+    'recording_requested': False,
+    # (st method name, message) from the last recording, shown once after its rerun
+    'recording_notice': None,
+    # Set by the final Next; complete_interview ends in st.rerun(), so the celebration
+    # is shown on the run after it and then cleared
+    'completion_notice': False,
+    'last_audio_path': None,
+    'last_video_path': None,
+    # Skill names in candidate_skills order, kept in step by _rebuild_skill_index
+    'skill_names': (),
+    # Job requirement fit (0-100) of candidate_skills, kept in step by _rebuild_skill_index
+    'skills_match_score': 0,
+    # Number of True entries in answered_mask, kept in step by _set_answer
+    'answered_count': 0,
+    # Question whose stored answer is loaded in the shared answer_input text area
+    'answer_input_index': None,
+}
+
+_DEFAULT_SESSION_FACTORIES = {
+    'candidate_skills': list,
+    'candidate_skills_by_cat': lambda: {'technical': [], 'soft': []},
+    'skill_chips': lambda: {'technical': "", 'soft': ""},
+    'interview_questions': list,
+    'question_types': list,
+    'candidate_answers': list,
+    'answered_mask': list,
+    'qna_rows': list,
+    'bias_reports': list,
+    # Severity -> number of answers currently reported at that severity
+    'bias_counts': Counter,
+    # Indices of questions whose bias report lists at least one bias type
+    'biased_questions': set,
+    'ai_enhanced_questions': list,
+    'answer_analysis': list,
+    'follow_up_questions': list,
+    'skills_graph': dict,
+    'skills_data': dict,
+    'skills_df': lambda: _skills_frame({}),
+    'candidate_skills_df': lambda: pd.DataFrame(columns=_CANDIDATE_SKILLS_COLUMNS),
+    'skill_category_counts': dict,
+    'skill_category_confidence': dict,
+    # Skills charts built for the current resume, keyed by chart key
+    'skills_figures': dict,
+    'answer_scores': list,
+    # Rolling window of the last three scores for difficulty adjustment
+    'recent_scores': lambda: deque(maxlen=3),
+    'bias_history': list,
+    'question_bias_warnings': list,
+    'interview_data': lambda: {
+        'questions': [], 'answers': [], 'bias_analysis': [],
+        'start_time': None, 'end_time': None,
+        'start_ns': None, 'end_ns': None
+    },
+    # NEW: Analytics data
+    'analytics_data': dict,
+    'comparative_data': dict,
+    'candidate_pool': list,
+    # NEW: Audio/Video analysis results
+    'speech_analysis': dict,
+    'video_analysis': dict,
+}
+
+# Settings that survive "start new interview"
+_PRESERVED_SESSION_KEYS = frozenset({'ai_enabled', 'selected_language', 'audio_video_enabled'})
 
 class FairAIHireApp:
     def __init__(self):
+        # Each component is built at most once per run; a failing constructor
+        # is reported and stops the run instead of being rebuilt
+        self.parser = self._safe_init(_get_parser)
+        self.question_gen = self._safe_init(_get_question_generator)
+        self.ai_enhancer = self._safe_init(_get_ai_enhancer)
+        self.analytics_engine = self._safe_init(_get_analytics_engine)
+        
+        # Module-level singletons - plain references, nothing is constructed here
+        self.bias_heatmap = bias_heatmap
+        self.difficulty_manager = difficulty_manager
+        self.heatmap_generator = heatmap_generator
+        self.language_support = language_support
+        
+        self.setup_page()
+    
+    @property
+    def av_processor(self):
+        """Audio/video processor, imported on first use"""
+        return _get_av_processors()[0]
+    
+    @property
+    def realtime_av_processor(self):
+        """Real-time audio/video processor, imported on first use"""
+        return _get_av_processors()[1]
+    
+    def _safe_init(self, factory):
+        """Build one component, reporting a failure once and re-raising it (no retry)"""
         try:
-            self.parser = ResumeParser()
-            self.question_gen = QuestionGenerator()
-            self.ai_enhancer = AIEnhancer()
-            # NEW: Initialize the new components
-            self.bias_heatmap = bias_heatmap
-            self.difficulty_manager = difficulty_manager
-            self.heatmap_generator = heatmap_generator
-            self.analytics_engine = AnalyticsEngine()
-            self.language_support = language_support
-            # NEW: Initialize audio/video processors
-            self.av_processor = av_processor
-            self.realtime_av_processor = realtime_av_processor
+            return factory()
         except Exception as e:
             st.error(f"Error initializing: {e}")
-            self.parser = ResumeParser()
-            self.question_gen = QuestionGenerator()
-            self.ai_enhancer = AIEnhancer()
-            # NEW: Initialize fallbacks
-            self.bias_heatmap = bias_heatmap
-            self.difficulty_manager = difficulty_manager
-            self.heatmap_generator = heatmap_generator
-            self.analytics_engine = AnalyticsEngine()
-            self.language_support = language_support
-            self.av_processor = AudioVideoProcessor()
-            self.realtime_av_processor = RealtimeAudioVideoProcessor()
-        
-        self.setup_page()
+            raise
     
     def setup_page(self):
         st.set_page_config(
@@ -418,224 +1122,63 @@ class FairAIHireApp:
         )
         
         # Enhanced CSS for dark/light theme compatibility
-        st.markdown("""
-        <style>
-        .main-header {
-            font-size: 2.5rem;
-            color: #1f77b4;
-            text-align: center;
-            margin-bottom: 2rem;
-            font-weight: bold;
-        }
-        .skill-chip {
-            background-color: #2e86ab;
-            color: white;
-            padding: 0.4rem 1rem;
-            border-radius: 20px;
-            margin: 0.3rem;
-            display: inline-block;
-            font-size: 0.9rem;
-            font-weight: 500;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        .skill-chip-technical {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        }
-        .skill-chip-soft {
-            background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        }
-        .question-box {
-            background-color: #1e1e1e;
-            color: white;
-            padding: 1.5rem;
-            border-radius: 10px;
-            border-left: 6px solid #1f77b4;
-            margin: 1rem 0;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }
-        .ai-enhanced-box {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 1.5rem;
-            border-radius: 10px;
-            border-left: 6px solid #ffd700;
-            margin: 1rem 0;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }
-        .section-header {
-            color: #1f77b4;
-            font-size: 1.8rem;
-            margin: 1.5rem 0 1rem 0;
-            border-bottom: 2px solid #1f77b4;
-            padding-bottom: 0.5rem;
-        }
-        .progress-text {
-            color: white;
-            font-weight: bold;
-            text-align: center;
-        }
-        .custom-container {
-            background-color: #1e1e1e;
-            padding: 2rem;
-            border-radius: 10px;
-            margin: 1rem 0;
-            border: 1px solid #333;
-        }
-        .summary-card {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            padding: 1.5rem;
-            border-radius: 10px;
-            color: white;
-            margin: 0.5rem 0;
-        }
-        .ai-analysis-box {
-            background: linear-gradient(135deg, #4CAF50 0%, #45a049 100%);
-            color: white;
-            padding: 1rem;
-            border-radius: 8px;
-            margin: 0.5rem 0;
-        }
-        .bias-alert-box {
-            background: linear-gradient(135deg, #dc3545 0%, #c82333 100%);
-            color: white;
-            padding: 1rem;
-            border-radius: 8px;
-            margin: 0.5rem 0;
-            border-left: 6px solid #ff6b6b;
-        }
-        .recruiter-metric-card {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            padding: 1.5rem;
-            border-radius: 10px;
-            color: white;
-            text-align: center;
-            margin: 0.5rem;
-        }
-        .hire-confidence-high {
-            background: linear-gradient(135deg, #28a745 0%, #20c997 100%);
-        }
-        .hire-confidence-medium {
-            background: linear-gradient(135deg, #ffc107 0%, #fd7e14 100%);
-        }
-        .hire-confidence-low {
-            background: linear-gradient(135deg, #dc3545 0%, #e83e8c 100%);
-        }
-        .stTextArea textarea {
-            background-color: #2b2b2b !important;
-            color: white !important;
-            border: 1px solid #555 !important;
-        }
-        p, div, span, h1, h2, h3, h4, h5, h6 {
-            color: white !important;
-        }
-        .language-selector {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            padding: 1rem;
-            border-radius: 10px;
-            margin: 1rem 0;
-            color: white;
-        }
-        .av-controls {
-            background: linear-gradient(135deg, #28a745 0%, #20c997 100%);
-            padding: 1.5rem;
-            border-radius: 10px;
-            margin: 1rem 0;
-            color: white;
-        }
-        .recording-active {
-            background: linear-gradient(135deg, #dc3545 0%, #e83e8c 100%);
-            animation: pulse 1.5s infinite;
-        }
-        @keyframes pulse {
-            0% { opacity: 1; }
-            50% { opacity: 0.7; }
-            100% { opacity: 1; }
-        }
-        </style>
-        """, unsafe_allow_html=True)
+        st.markdown(_load_css(), unsafe_allow_html=True)
     
     def initialize_session_state(self):
         """Initialize all session state variables"""
-        defaults = {
-            'current_question_index': 0,
-            'candidate_skills': [],
-            'candidate_experience': "Unknown",
-            'interview_questions': [],
-            'candidate_answers': [],
-            'bias_reports': [],
-            'interview_started': False,
-            'interview_completed': False,
-            'resume_analyzed': False,
-            'ai_enabled': False,
-            'ai_enhanced_questions': [],
-            'answer_analysis': [],
-            'follow_up_questions': [],
-            'skills_graph': {},
-            'skills_data': {},
-            # NEW: Add difficulty tracking and bias history
-            'current_difficulty': 'Medium',
-            'answer_scores': [],
-            'bias_history': [],
-            'question_bias_warnings': [],
-            'interview_data': {
-                'questions': [], 'answers': [], 'bias_analysis': [],
-                'start_time': None, 'end_time': None
-            },
-            # NEW: Analytics data
-            'analytics_data': {},
-            'comparative_data': {},
-            'candidate_pool': [],
-            # NEW: Language support
-            'selected_language': 'English',
-            'auto_detected_language': None,
-            'resume_language_detected': False,
-            # NEW: Audio/Video recording state
-            'audio_video_enabled': False,
-            'recording_in_progress': False,
-            'last_audio_path': None,
-            'last_video_path': None,
-            'speech_analysis': {},
-            'video_analysis': {}
-        }
+        for key, value in _DEFAULT_SESSION_STATE.items():
+            st.session_state.setdefault(key, value)
         
-        for key, value in defaults.items():
+        # Mutable defaults get a fresh object, built only when the key is missing
+        for key, factory in _DEFAULT_SESSION_FACTORIES.items():
             if key not in st.session_state:
-                st.session_state[key] = value
+                st.session_state[key] = factory()
     
     def reset_interview(self):
         """Reset the interview session"""
-        for key in list(st.session_state.keys()):
-            if key not in ['ai_enabled', 'selected_language', 'audio_video_enabled']:  # Keep AI and language settings
-                del st.session_state[key]
+        # Keep AI and language settings: snapshot them, clear everything, restore
+        preserved = {key: st.session_state[key] for key in _PRESERVED_SESSION_KEYS if key in st.session_state}
+        st.session_state.clear()
+        st.session_state.update(preserved)
         self.initialize_session_state()
     
     def get_translated_text(self, text_key):
         """Get translated text for current language"""
-        return self.language_support.translate_ui_text(text_key, st.session_state.selected_language)
+        language = st.session_state.selected_language
+        if language == _DEFAULT_LANGUAGE:
+            return _DEFAULT_STRINGS.get(text_key, text_key)
+        return translate_ui_text(text_key, language)
+    
+    def _rebuild_skill_index(self):
+        """Split candidate skills by category in one pass (call whenever candidate_skills changes)"""
+        skills_by_cat = {'technical': [], 'soft': []}
+        for skill, category, _ in st.session_state.candidate_skills:
+            if category in skills_by_cat:
+                # Normalize once here so lookups against lowercase targets never miss on casing
+                skills_by_cat[category].append(skill.lower())
+        st.session_state.candidate_skills_by_cat = skills_by_cat
+        st.session_state.skills_match_score = _skills_match_score(skills_by_cat['technical'], skills_by_cat['soft'])
+        # Chip rows are rendered on every rerun, so their HTML is built here once
+        st.session_state.skill_chips = {
+            'technical': "".join(map(_CHIP_TECH, (skill.title() for skill in skills_by_cat['technical']))),
+            'soft': "".join(map(_CHIP_SOFT, (skill.title() for skill in skills_by_cat['soft']))),
+        }
+        st.session_state.skill_names = tuple(skill for skill, _, _ in st.session_state.candidate_skills)
+        # Column layout for the simple charts and the fallback table, built once per resume
+        st.session_state.candidate_skills_df = pd.DataFrame(st.session_state.candidate_skills,
+                                                            columns=_CANDIDATE_SKILLS_COLUMNS)
     
     def _create_fallback_skills_graph(self, skills_result):
         """Create a fallback skills graph when parsing fails"""
-        fallback_graph = {}
-        
-        for i, (skill_name, category, confidence) in enumerate(skills_result):
-            class SkillNode:
-                def __init__(self, skill, category, confidence):
-                    self.skill = skill
-                    self.confidence = confidence
-                    self.category = category
-                    self.frequency = 1
-                    self.related_skills = []
-            
-            fallback_graph[skill_name] = SkillNode(skill_name, category, confidence)
-        
-        return fallback_graph
+        return {skill_name: SkillNode(skill_name, category, confidence)
+                for skill_name, category, confidence in skills_result}
 
     def analyze_resume(self, resume_text):
         """Analyze resume and extract skills/experience"""
         try:
             # Auto-detect language from resume if not already detected
             if not st.session_state.resume_language_detected:
-                detected_lang = self.language_support.detect_language(resume_text)
+                detected_lang = _detect_language_cached(resume_text)
                 st.session_state.auto_detected_language = detected_lang
                 st.session_state.resume_language_detected = True
                 
@@ -644,117 +1187,106 @@ class FairAIHireApp:
                     st.session_state.selected_language = detected_lang
                     st.success(f"🌍 {self.get_translated_text('auto_detect')}: {detected_lang}")
             
-            skills_result = self.parser.extract_skills(resume_text)
-            experience_level = self.parser.parse_experience(resume_text)
+            analysis = _analyze_resume_cached(resume_text)
+            skills_result = analysis['skills_result']
+            experience_level = analysis['experience_level']
             
             st.session_state.candidate_skills = skills_result
+            self._rebuild_skill_index()
             st.session_state.candidate_experience = experience_level
             st.session_state.resume_analyzed = True
             
             # Build skills graph for visualization - FIXED: Handle dictionary return
-            skills_graph = build_skills_graph(resume_text)
+            skills_graph = analysis['skills_graph']
             st.session_state.skills_graph = skills_graph
             
-            # Convert to the expected format for visualization
+            # Convert to the expected format for visualization. skills_data is
+            # already set when the graph is a dictionary with the right structure.
+            skills_data = analysis['skills_data']
             if skills_graph and isinstance(skills_graph, dict):
-                # If it's already a dictionary with the right structure, use as-is
-                if all(isinstance(v, dict) and 'confidence' in v for v in skills_graph.values()):
-                    st.session_state.skills_data = get_skills_by_category(skills_graph)
-                else:
+                if skills_data is None:
                     # Convert to the expected format
-                    converted_graph = {}
-                    for skill_name, skill_data in skills_graph.items():
-                        if hasattr(skill_data, '__dict__'):
-                            # It's already an object with attributes
-                            converted_graph[skill_name] = skill_data
-                        else:
-                            # Create a mock object with the expected attributes
-                            class SkillNode:
-                                def __init__(self, name, data):
-                                    self.skill = name
-                                    self.confidence = data.get('confidence', 0.7) if isinstance(data, dict) else 0.7
-                                    self.category = data.get('category', 'technical') if isinstance(data, dict) else 'technical'
-                                    self.frequency = data.get('frequency', 1) if isinstance(data, dict) else 1
-                                    self.related_skills = data.get('related_skills', []) if isinstance(data, dict) else []
-                            
-                            converted_graph[skill_name] = SkillNode(skill_name, skill_data)
-                    
-                    st.session_state.skills_graph = converted_graph
-                    st.session_state.skills_data = get_skills_by_category(converted_graph)
+                    st.session_state.skills_graph = {
+                        skill_name: _normalize_node(skill_data, skill_name)
+                        for skill_name, skill_data in skills_graph.items()
+                    }
             else:
                 # Create fallback skills data
                 st.session_state.skills_graph = self._create_fallback_skills_graph(skills_result)
-                st.session_state.skills_data = get_skills_by_category(st.session_state.skills_graph)
             
+            if skills_data is None:
+                skills_data = get_skills_by_category(st.session_state.skills_graph)
+            st.session_state.skills_data = skills_data
+            st.session_state.skill_category_counts = analysis['category_counts']
+            st.session_state.skill_category_confidence = analysis['category_confidence']
+            st.session_state.skills_df = _skills_frame(st.session_state.skills_graph)
+            st.session_state.skills_figures = {}
             return True
         except Exception as e:
             st.error(f"Error analyzing resume: {str(e)}")
             # Create fallback skills data
             st.session_state.skills_graph = self._create_fallback_skills_graph(st.session_state.candidate_skills)
             st.session_state.skills_data = get_skills_by_category(st.session_state.skills_graph)
+            (st.session_state.skill_category_counts,
+             st.session_state.skill_category_confidence) = _category_stats(st.session_state.candidate_skills)
+            st.session_state.skills_df = _skills_frame(st.session_state.skills_graph)
+            st.session_state.skills_figures = {}
             return True  # Continue anyway with fallback data
     
     def create_simple_skills_graph(self, skills_result):
         """Create a simple skills graph from extracted skills"""
-        skills_graph = {}
-        for skill, category, confidence in skills_result:
-            skills_graph[skill] = {
+        return {
+            skill: {
                 'skill': skill,
                 'category': category,
                 'confidence': confidence,
                 'frequency': 1,
                 'related_skills': []
             }
-        return skills_graph
+            for skill, category, confidence in skills_result
+        }
     
     def generate_interview_questions(self):
         """Generate personalized interview questions with bias checking and language adaptation"""
         try:
-            questions = self.question_gen.generate_questions(
-                st.session_state.candidate_skills,
-                st.session_state.candidate_experience
+            questions, checked_questions, bias_checks = _prepare_questions(
+                self.question_gen, st.session_state.candidate_skills,
+                st.session_state.candidate_experience, st.session_state.selected_language
             )
             
-            # Adapt questions to selected language
-            adapted_questions = []
-            for question in questions:
-                adapted_question = self.language_support.adapt_question_for_language(
-                    question, 
-                    st.session_state.selected_language
-                )
-                adapted_questions.append(adapted_question)
-            
-            # NEW: Check questions for potential bias before displaying
-            checked_questions = []
-            bias_warnings = []
-            
-            for i, question in enumerate(adapted_questions):
-                try:
-                    bias_check = analyze_question_fairness(question)
-                    # FIXED: Use .get() with default value to avoid KeyError
-                    risk_level = bias_check.get('risk_level', 'Low')
-                    suggestion = bias_check.get('suggestion', 'Consider rephrasing this question')
-                    
-                    if risk_level == 'High':
-                        bias_warnings.append(f"Question {i+1}: {suggestion}")
-                except Exception as e:
-                    # If bias checking fails, log but continue
-                    print(f"Bias check warning for question {i+1}: {str(e)}")
-                    # Continue with the question anyway
-                
-                checked_questions.append(question)
+            bias_warnings = [
+                f"Question {i+1}: {suggestion}"
+                for i, (risk_level, suggestion) in enumerate(bias_checks)
+                if risk_level == 'High'
+            ]
             
             # Store bias warnings for later reference
             st.session_state.question_bias_warnings = bias_warnings
             
             st.session_state.interview_questions = checked_questions
+            # A question is technical if it mentions any technical skill (names are already lowercased)
+            tech_skills = st.session_state.candidate_skills_by_cat['technical']
+            st.session_state.question_types = [
+                'technical' if any(skill in question_lc for skill in tech_skills) else 'soft'
+                for question_lc in map(str.lower, checked_questions)
+            ]
             st.session_state.candidate_answers = [""] * len(checked_questions)
+            st.session_state.answered_mask = [False] * len(checked_questions)
+            st.session_state.answered_count = 0
+            st.session_state.answer_input_index = None
             st.session_state.bias_reports = [None] * len(checked_questions)
+            st.session_state.bias_counts = Counter()
+            st.session_state.biased_questions = set()
             st.session_state.answer_analysis = [None] * len(checked_questions)
             st.session_state.follow_up_questions = [None] * len(checked_questions)
+            st.session_state.qna_rows = [QnARow(question, "", None, None, None) for question in checked_questions]
             st.session_state.interview_started = True
             st.session_state.interview_data['questions'] = checked_questions
+            # Slots are filled by index as answers come in, in any order
+            st.session_state.interview_data['answers'] = [None] * len(checked_questions)
+            st.session_state.interview_data['bias_analysis'] = [None] * len(checked_questions)
             st.session_state.interview_data['start_time'] = datetime.now()
+            st.session_state.interview_data['start_ns'] = time.monotonic_ns()
             
             # Show bias warnings if any
             if bias_warnings and st.session_state.ai_enabled:
@@ -766,83 +1298,111 @@ class FairAIHireApp:
             # Generate AI-enhanced questions if enabled
             if st.session_state.ai_enabled and self.ai_enhancer.available:
                 with st.spinner(f"🤖 {self.get_translated_text('ai_enhancement')}..."):
-                    st.session_state.ai_enhanced_questions = []
-                    for i, question in enumerate(questions):
-                        enhanced = self.ai_enhancer.improve_question(
-                            question, 
-                            f"Skills: {[skill[0] for skill in st.session_state.candidate_skills]}"
-                        )
-                        st.session_state.ai_enhanced_questions.append(enhanced)
+                    # Independent Ollama requests - issue them together instead of one after another
+                    context = f"Skills: {list(st.session_state.skill_names)}"
+                    with ThreadPoolExecutor(max_workers=min(8, max(1, len(questions)))) as pool:
+                        st.session_state.ai_enhanced_questions = list(pool.map(
+                            lambda question: self.ai_enhancer.improve_question(question, context),
+                            questions
+                        ))
             
             return True
         except Exception as e:
             st.error(f"Error generating questions: {str(e)}")
             return False
     
+    def _set_answer(self, question_index, answer_text):
+        """Store an answer and keep answered_mask and answered_count in sync (strip once, read everywhere)"""
+        answered = bool(answer_text and answer_text.strip())
+        st.session_state.answered_count += answered - st.session_state.answered_mask[question_index]
+        st.session_state.candidate_answers[question_index] = answer_text
+        st.session_state.answered_mask[question_index] = answered
+        st.session_state.qna_rows[question_index] = st.session_state.qna_rows[question_index]._replace(answer=answer_text)
+    
+    def _sync_qna_row(self, question_index):
+        """Refresh one QnARow from the per-field session lists after a submission"""
+        st.session_state.qna_rows[question_index] = QnARow(
+            st.session_state.interview_questions[question_index],
+            st.session_state.candidate_answers[question_index],
+            st.session_state.bias_reports[question_index],
+            st.session_state.answer_analysis[question_index],
+            st.session_state.follow_up_questions[question_index],
+        )
+    
     def submit_answer(self, answer_text, question_index):
         """Submit answer and run bias detection"""
         if answer_text.strip():
-            st.session_state.candidate_answers[question_index] = answer_text
+            self._set_answer(question_index, answer_text)
             
             # Run bias detection with language-specific patterns
             bias_result = detect_bias_in_text(answer_text)
+            
+            # Keep severity counts current by swapping out the previous report for this question
+            bias_counts = st.session_state.bias_counts
+            previous_report = st.session_state.bias_reports[question_index]
+            if previous_report:
+                bias_counts[previous_report.get('severity')] -= 1
+            bias_counts[bias_result.get('severity')] += 1
+            # ...and the set of questions with at least one bias type
+            if bias_result.get('bias_types'):
+                st.session_state.biased_questions.add(question_index)
+            else:
+                st.session_state.biased_questions.discard(question_index)
             st.session_state.bias_reports[question_index] = bias_result
             
             # NEW: Assess answer quality and update difficulty
             current_question = st.session_state.interview_questions[question_index]
-            question_type = 'technical' if any(skill[0].lower() in current_question.lower() 
-                                            for skill in st.session_state.candidate_skills 
-                                            if skill[1] == 'technical') else 'soft'
+            question_type = st.session_state.question_types[question_index]
             
             quality_score = self.difficulty_manager.assess_answer_quality(answer_text, question_type)
             st.session_state.answer_scores.append(quality_score)
+            st.session_state.recent_scores.append(quality_score)
             
-            # Update difficulty based on recent performance
-            recent_scores = st.session_state.answer_scores[-3:]  # Last 3 answers
+            # Update difficulty based on recent performance (last 3 answers)
             new_difficulty = self.difficulty_manager.get_next_difficulty(
-                st.session_state.current_difficulty, recent_scores
+                st.session_state.current_difficulty, list(st.session_state.recent_scores)
             )
             st.session_state.current_difficulty = new_difficulty
             
             # NEW: Update bias history for trend analysis
             bias_entry = {
                 'timestamp': datetime.now(),
-                'high_count': len([r for r in st.session_state.bias_reports if r and r.get('severity') == 'High']),
-                'medium_count': len([r for r in st.session_state.bias_reports if r and r.get('severity') == 'Medium']),
-                'low_count': len([r for r in st.session_state.bias_reports if r and r.get('severity') == 'Low'])
+                'high_count': bias_counts['High'],
+                'medium_count': bias_counts['Medium'],
+                'low_count': bias_counts['Low']
             }
             st.session_state.bias_history.append(bias_entry)
             
             # Run AI analysis if enabled
             if st.session_state.ai_enabled and self.ai_enhancer.available:
                 with st.spinner(f"🤖 {self.get_translated_text('ai_analysis_previous_answer')}..."):
-                    skills_list = [skill[0] for skill in st.session_state.candidate_skills]
-                    analysis = self.ai_enhancer.analyze_answer_depth(
-                        answer_text, 
-                        st.session_state.interview_questions[question_index],
-                        skills_list
-                    )
-                    st.session_state.answer_analysis[question_index] = analysis
+                    skills_list = st.session_state.skill_names
                     
                     # Generate follow-up question
                     skill_focus = None
                     if skills_list and question_index < len(skills_list):
                         skill_focus = skills_list[min(question_index, len(skills_list)-1)]
                     
+                    # The depth analysis and the follow-up are independent Ollama calls - run them together
+                    analysis_future = _get_executor().submit(
+                        self.ai_enhancer.analyze_answer_depth,
+                        answer_text,
+                        current_question,
+                        skills_list
+                    )
                     follow_up = self.ai_enhancer.generate_follow_up_question(
                         answer_text,
-                        st.session_state.interview_questions[question_index],
+                        current_question,
                         skill_focus
                     )
+                    st.session_state.answer_analysis[question_index] = analysis_future.result()
                     st.session_state.follow_up_questions[question_index] = follow_up
             
+            self._sync_qna_row(question_index)
+            
             # Update interview data
-            if question_index < len(st.session_state.interview_data['answers']):
-                st.session_state.interview_data['answers'][question_index] = answer_text
-                st.session_state.interview_data['bias_analysis'][question_index] = bias_result
-            else:
-                st.session_state.interview_data['answers'].append(answer_text)
-                st.session_state.interview_data['bias_analysis'].append(bias_result)
+            st.session_state.interview_data['answers'][question_index] = answer_text
+            st.session_state.interview_data['bias_analysis'][question_index] = bias_result
             
             return True
         return False
@@ -858,6 +1418,7 @@ class FairAIHireApp:
         """Mark interview as completed"""
         st.session_state.interview_completed = True
         st.session_state.interview_data['end_time'] = datetime.now()
+        st.session_state.interview_data['end_ns'] = time.monotonic_ns()
         
         # Generate analytics when interview is completed
         self.generate_candidate_analytics()
@@ -873,14 +1434,15 @@ class FairAIHireApp:
             }
             
             # Calculate candidate fit
-            skills_fit = self.analytics_engine.calculate_candidate_fit(
+            skills_fit = _candidate_fit(
+                self.analytics_engine,
                 st.session_state.skills_graph,
                 job_requirements
             )
             
             # Analyze communication skills
-            answers_data = [{'text': answer, 'response_time': 5} for answer in st.session_state.candidate_answers if answer.strip()]
-            communication_analysis = self.analytics_engine.analyze_communication_skills(answers_data)
+            answer_texts = tuple(answer for answer, answered in zip(st.session_state.candidate_answers, st.session_state.answered_mask) if answered)
+            communication_analysis = _communication_analysis(self.analytics_engine, answer_texts)
             
             # Generate improvement recommendations
             improvement_recommendations = self.analytics_engine.generate_improvement_recommendations({
@@ -895,16 +1457,21 @@ class FairAIHireApp:
                 'communication_analysis': communication_analysis
             })
             
+            # Bias count is tracked incrementally as answers are submitted
+            bias_count = len(st.session_state.biased_questions)
+            
             # Store analytics data
             st.session_state.analytics_data = {
                 'skills_fit': skills_fit,
                 'communication_analysis': communication_analysis,
                 'hire_confidence': hire_confidence,
                 'improvement_recommendations': improvement_recommendations,
-                'summary_insights': self.generate_automated_insights({
+                'bias_count': bias_count,
+                'summary_insights': _automated_insights({
                     'skills_fit': skills_fit,
                     'communication_analysis': communication_analysis,
-                    'hire_confidence': hire_confidence
+                    'hire_confidence': hire_confidence,
+                    'bias_count': bias_count
                 })
             }
             
@@ -943,112 +1510,45 @@ class FairAIHireApp:
                 ]
             }
     
-    def generate_automated_insights(self, analytics_data):
-        """Generate automated insights based on analytics"""
-        insights = []
-        
-        skills_fit = analytics_data.get('skills_fit', {})
-        communication = analytics_data.get('communication_analysis', {})
-        hire_confidence = analytics_data.get('hire_confidence', 0)
-        
-        # Skills insights
-        if skills_fit.get('overall_score', 0) >= 80:
-            insights.append("🎯 Excellent skills match with job requirements")
-        elif skills_fit.get('overall_score', 0) >= 60:
-            insights.append("✅ Good skills alignment with some development areas")
-        else:
-            insights.append("📝 Significant skills gap identified - consider training")
-        
-        # Communication insights
-        if communication.get('coherence_score', 0) >= 70:
-            insights.append("💬 Strong communication skills demonstrated")
-        else:
-            insights.append("🗣️ Communication skills need improvement")
-        
-        # Bias insights
-        bias_count = len([r for r in st.session_state.bias_reports if r and r.get('bias_types')])
-        if bias_count == 0:
-            insights.append("⚖️ Low bias risk detected throughout interview")
-        else:
-            insights.append(f"⚠️ {bias_count} potential bias(es) identified")
-        
-        # Hire confidence insights
-        if hire_confidence >= 80:
-            insights.append("🏆 High hire confidence - strong candidate")
-        elif hire_confidence >= 60:
-            insights.append("👍 Moderate hire confidence - consider for next round")
-        else:
-            insights.append("🤔 Lower hire confidence - review carefully")
-        
-        return insights
-    
+    @_fragment
     def display_recruiter_dashboard(self):
         """Display comprehensive recruiter dashboard with analytics"""
-        st.markdown(f'<div class="section-header">{self.get_translated_text("recruiter_dashboard")}</div>', unsafe_allow_html=True)
+        _t = self.get_translated_text
+        st.markdown(f'<div class="section-header">{_t("recruiter_dashboard")}</div>', unsafe_allow_html=True)
         
         if not st.session_state.analytics_data:
-            st.info(self.get_translated_text("complete_interview_to_see"))
+            st.info(_t("complete_interview_to_see"))
             return
         
         analytics_data = st.session_state.analytics_data
         
         # Key Metrics Row
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            overall_score = analytics_data['skills_fit'].get('overall_score', 0)
-            st.markdown(f"""
-            <div class="recruiter-metric-card">
-                <h3>🎯 {self.get_translated_text("overall_match")}</h3>
-                <h1>{overall_score}%</h1>
-                <p>{self.get_translated_text("job_requirement_fit")}</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            hire_confidence = analytics_data.get('hire_confidence', 0)
-            confidence_class = "hire-confidence-high" if hire_confidence >= 80 else "hire-confidence-medium" if hire_confidence >= 60 else "hire-confidence-low"
-            st.markdown(f"""
-            <div class="recruiter-metric-card {confidence_class}">
-                <h3>🏆 {self.get_translated_text("hire_confidence")}</h3>
-                <h1>{hire_confidence}%</h1>
-                <p>{self.get_translated_text("recommended_score")}</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            coherence_score = analytics_data['communication_analysis'].get('coherence_score', 0)
-            st.markdown(f"""
-            <div class="recruiter-metric-card">
-                <h3>💬 {self.get_translated_text("communication")}</h3>
-                <h1>{coherence_score}%</h1>
-                <p>{self.get_translated_text("coherence_score")}</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            bias_count = len([r for r in st.session_state.bias_reports if r and r.get('bias_types')])
-            bias_score = max(0, 100 - (bias_count * 15))
-            st.markdown(f"""
-            <div class="recruiter-metric-card">
-                <h3>⚖️ {self.get_translated_text("fairness")}</h3>
-                <h1>{bias_score}%</h1>
-                <p>{self.get_translated_text("bias_free_score")}</p>
-            </div>
-            """, unsafe_allow_html=True)
+        overall_score = analytics_data['skills_fit'].get('overall_score', 0)
+        hire_confidence = analytics_data.get('hire_confidence', 0)
+        confidence_class = " hire-confidence-high" if hire_confidence >= 80 else " hire-confidence-medium" if hire_confidence >= 60 else " hire-confidence-low"
+        coherence_score = analytics_data['communication_analysis'].get('coherence_score', 0)
+        bias_count = len(st.session_state.biased_questions)
+        bias_score = max(0, 100 - (bias_count * 15))
+        
+        st.markdown(_recruiter_cards((
+            ("", "🎯", _t("overall_match"), overall_score, _t("job_requirement_fit")),
+            (confidence_class, "🏆", _t("hire_confidence"), hire_confidence, _t("recommended_score")),
+            ("", "💬", _t("communication"), coherence_score, _t("coherence_score")),
+            ("", "⚖️", _t("fairness"), bias_score, _t("bias_free_score")),
+        )), unsafe_allow_html=True)
         
         # Automated Insights
-        st.markdown(f"### 🤖 {self.get_translated_text('automated_insights')}")
+        st.markdown(f"### 🤖 {_t('automated_insights')}")
         insights = analytics_data.get('summary_insights', [])
         for insight in insights:
             st.info(insight)
         
         # Detailed Analytics Tabs
         tab1, tab2, tab3, tab4 = st.tabs([
-            f"📊 {self.get_translated_text('skills_analysis')}",
-            f"💬 {self.get_translated_text('communication')}",
-            f"🎯 {self.get_translated_text('recommendations')}",
-            f"📈 {self.get_translated_text('candidate_comparison')}"
+            f"📊 {_t('skills_analysis')}",
+            f"💬 {_t('communication')}",
+            f"🎯 {_t('recommendations')}",
+            f"📈 {_t('candidate_comparison')}"
         ])
         
         with tab1:
@@ -1064,14 +1564,14 @@ class FairAIHireApp:
             self.display_comparative_analytics()
         
         # Export Functionality
-        st.markdown(f"### 📤 {self.get_translated_text('export_analysis')}")
+        st.markdown(f"### 📤 {_t('export_analysis')}")
         col1, col2 = st.columns(2)
         
         with col1:
-            if st.button(f"📄 {self.get_translated_text('generate_full_report')}", use_container_width=True):
+            if st.button(f"📄 {_t('generate_full_report')}", use_container_width=True):
                 report = self.generate_analytics_report()
                 st.download_button(
-                    label=f"📥 {self.get_translated_text('download_report')}",
+                    label=f"📥 {_t('download_report')}",
                     data=report,
                     file_name=f"candidate_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
                     mime="text/plain",
@@ -1079,7 +1579,7 @@ class FairAIHireApp:
                 )
         
         with col2:
-            if st.button(f"🔄 {self.get_translated_text('analyze_new_candidate')}", type="primary", use_container_width=True):
+            if st.button(f"🔄 {_t('analyze_new_candidate')}", type="primary", use_container_width=True):
                 self.reset_interview()
                 st.rerun()
     
@@ -1091,27 +1591,7 @@ class FairAIHireApp:
             st.markdown(f"#### 🎯 {self.get_translated_text('skills_match_breakdown')}")
             
             # Create skills match gauge
-            fig = go.Figure(go.Indicator(
-                mode = "gauge+number+delta",
-                value = skills_fit.get('overall_score', 0),
-                domain = {'x': [0, 1], 'y': [0, 1]},
-                title = {'text': self.get_translated_text("overall_match")},
-                gauge = {
-                    'axis': {'range': [None, 100]},
-                    'bar': {'color': "darkblue"},
-                    'steps': [
-                        {'range': [0, 50], 'color': "lightgray"},
-                        {'range': [50, 80], 'color': "gray"},
-                        {'range': [80, 100], 'color': "darkgray"}
-                    ],
-                    'threshold': {
-                        'line': {'color': "red", 'width': 4},
-                        'thickness': 0.75,
-                        'value': 90
-                    }
-                }
-            ))
-            fig.update_layout(height=300)
+            fig = _skills_match_gauge(skills_fit.get('overall_score', 0), self.get_translated_text("overall_match"))
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
@@ -1138,20 +1618,13 @@ class FairAIHireApp:
         with col1:
             st.markdown(f"#### 🗣️ {self.get_translated_text('communication_metrics')}")
             
-            metrics_data = {
-                'Metric': ['Coherence', 'Response Time', 'Answer Length', 'Confidence'],
-                'Score': [
-                    communication_analysis.get('coherence_score', 0),
-                    communication_analysis.get('avg_response_time_seconds', 0),
-                    communication_analysis.get('avg_answer_length', 0),
-                    communication_analysis.get('confidence_level', 0)
-                ],
-                'Target': [70, 5, 50, 70]
-            }
-            
-            df = pd.DataFrame(metrics_data)
-            fig = px.bar(df, x='Metric', y='Score', title=self.get_translated_text("communication_metrics"),
-                        color='Score', color_continuous_scale='Viridis')
+            scores = (
+                communication_analysis.get('coherence_score', 0),
+                communication_analysis.get('avg_response_time_seconds', 0),
+                communication_analysis.get('avg_answer_length', 0),
+                communication_analysis.get('confidence_level', 0)
+            )
+            fig = _communication_metrics_bar(scores, self.get_translated_text("communication_metrics"))
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
@@ -1204,11 +1677,12 @@ class FairAIHireApp:
         st.markdown(f"#### 📊 {self.get_translated_text('candidate_comparison')}")
         
         # Mock comparative data - in real implementation, this would come from database
-        comparative_data = self.analytics_engine.generate_comparative_analytics([
+        candidates_data = [
             {'candidate_id': 'current', 'analytics': st.session_state.analytics_data},
             {'candidate_id': 'candidate_2', 'analytics': {'skills_fit': {'overall_score': 65}, 'hire_confidence': 72}},
             {'candidate_id': 'candidate_3', 'analytics': {'skills_fit': {'overall_score': 88}, 'hire_confidence': 85}}
-        ])
+        ]
+        comparative_data = _comparative_analytics(self.analytics_engine, candidates_data)
         
         if comparative_data:
             # Ranking
@@ -1227,8 +1701,13 @@ class FairAIHireApp:
             st.markdown("##### 📈 Skills Comparison")
             skills_comparison = comparative_data.get('skills_comparison', {})
             if skills_comparison:
-                df = pd.DataFrame(skills_comparison)
-                fig = px.bar(df, barmode='group', title=self.get_translated_text("skills_comparison"))
+                # One grouped bar trace per skill. Bars are placed by position, as the
+                # DataFrame index did: the real engine lists proficiencies in input order
+                # and the fallback in ranked order, so no id list matches both
+                fig = go.Figure()
+                for skill, proficiencies in skills_comparison.items():
+                    fig.add_bar(name=skill, x=np.arange(len(proficiencies)), y=np.asarray(proficiencies))
+                fig.update_layout(barmode='group', title=self.get_translated_text("skills_comparison"))
                 st.plotly_chart(fig, use_container_width=True)
             
             # Diversity metrics
@@ -1242,67 +1721,26 @@ class FairAIHireApp:
     
     def generate_analytics_report(self):
         """Generate comprehensive analytics report"""
-        analytics_data = st.session_state.analytics_data
-        
-        report_lines = []
-        report_lines.append("=" * 70)
-        report_lines.append("              FAIRAI HIRE - CANDIDATE ANALYSIS REPORT")
-        report_lines.append("=" * 70)
-        report_lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report_lines.append("")
-        
-        # Executive Summary
-        report_lines.append("EXECUTIVE SUMMARY:")
-        report_lines.append(f"  • Overall Match Score: {analytics_data['skills_fit'].get('overall_score', 0)}%")
-        report_lines.append(f"  • Hire Confidence: {analytics_data.get('hire_confidence', 0)}%")
-        report_lines.append(f"  • Communication Score: {analytics_data['communication_analysis'].get('coherence_score', 0)}%")
-        report_lines.append("")
-        
-        # Skills Analysis
-        report_lines.append("SKILLS ANALYSIS:")
-        skills_fit = analytics_data['skills_fit']
-        report_lines.append(f"  • Required Skills Score: {skills_fit.get('required_skills_score', 0)}%")
-        report_lines.append(f"  • Preferred Skills Score: {skills_fit.get('preferred_skills_score', 0)}%")
-        report_lines.append(f"  • Key Strengths: {', '.join(skills_fit.get('strengths', []))}")
-        report_lines.append(f"  • Development Areas: {', '.join(skills_fit.get('weaknesses', []))}")
-        report_lines.append("")
-        
-        # Communication Analysis
-        report_lines.append("COMMUNICATION ANALYSIS:")
-        comm = analytics_data['communication_analysis']
-        report_lines.append(f"  • Coherence Score: {comm.get('coherence_score', 0)}%")
-        report_lines.append(f"  • Average Response Time: {comm.get('avg_response_time_seconds', 0)}s")
-        report_lines.append(f"  • Communication Style: {comm.get('communication_style', 'Unknown')}")
-        report_lines.append(f"  • Improvement Areas: {', '.join(comm.get('improvement_areas', []))}")
-        report_lines.append("")
-        
-        # Recommendations
-        report_lines.append("RECOMMENDATIONS:")
-        for i, rec in enumerate(analytics_data.get('improvement_recommendations', []), 1):
-            report_lines.append(f"  {i}. {rec}")
-        report_lines.append("")
-        
-        # Automated Insights
-        report_lines.append("AUTOMATED INSIGHTS:")
-        for insight in analytics_data.get('summary_insights', []):
-            report_lines.append(f"  • {insight}")
-        
-        report_lines.append("")
-        report_lines.append("=" * 70)
-        report_lines.append("           DATA-DRIVEN HIRING DECISIONS")
-        report_lines.append("=" * 70)
-        
-        return "\n".join(report_lines)
+        # The timestamp changes every call, so it stays outside the cached body
+        return "\n".join([
+            "=" * 70,
+            "              FAIRAI HIRE - CANDIDATE ANALYSIS REPORT",
+            "=" * 70,
+            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            "",
+            _build_analytics_report(st.session_state.analytics_data),
+        ])
 
     def sidebar_controls(self):
         """Display sidebar controls and information"""
+        _t = self.get_translated_text
         with st.sidebar:
-            st.markdown(f"### 🔧 {self.get_translated_text('session_controls')}")
+            st.markdown(f"### 🔧 {_t('session_controls')}")
             
             # Language Selector
-            st.markdown(f"### 🌍 {self.get_translated_text('interview_language')}")
+            st.markdown(f"### 🌍 {_t('interview_language')}")
             selected_language = st.selectbox(
-                self.get_translated_text('select_language'),
+                _t('select_language'),
                 options=self.language_support.supported_languages,
                 index=self.language_support.supported_languages.index(st.session_state.selected_language)
             )
@@ -1313,13 +1751,13 @@ class FairAIHireApp:
             
             # Show auto-detected language if available
             if st.session_state.auto_detected_language:
-                st.info(f"🌐 {self.get_translated_text('auto_detect')}: {st.session_state.auto_detected_language}")
+                st.info(f"🌐 {_t('auto_detect')}: {st.session_state.auto_detected_language}")
             
             st.markdown("---")
             
             # AI Enhancement Toggle
-            st.markdown(f"### 🤖 {self.get_translated_text('ai_enhancement')}")
-            ai_enabled = st.toggle(self.get_translated_text("enable_ai_features"), 
+            st.markdown(f"### 🤖 {_t('ai_enhancement')}")
+            ai_enabled = st.toggle(_t("enable_ai_features"), 
                                  value=st.session_state.ai_enabled,
                                  help="Use Ollama for enhanced question generation and answer analysis")
             
@@ -1336,8 +1774,8 @@ class FairAIHireApp:
             st.markdown("---")
             
             # NEW: Audio/Video Toggle
-            st.markdown(f"### 🎤🎥 {self.get_translated_text('audio_video')}")
-            av_enabled = st.toggle(self.get_translated_text("enable_av_recording"), 
+            st.markdown(f"### 🎤🎥 {_t('audio_video')}")
+            av_enabled = st.toggle(_t("enable_av_recording"), 
                                  value=st.session_state.audio_video_enabled,
                                  help="Enable audio/video recording and analysis features")
             
@@ -1351,38 +1789,38 @@ class FairAIHireApp:
                 st.info("🎤 Audio/Video Recording Disabled")
             
             st.markdown("---")
-            st.markdown(f"### 📊 {self.get_translated_text('current_status')}")
+            st.markdown(f"### 📊 {_t('current_status')}")
             
             if st.session_state.resume_analyzed:
-                st.success(f"✅ {self.get_translated_text('resume_analyzed')}")
-                st.write(f"{self.get_translated_text('skills_found')}: {len(st.session_state.candidate_skills)}")
-                st.write(f"{self.get_translated_text('experience_level')}: {st.session_state.candidate_experience}")
-                st.write(f"{self.get_translated_text('current_difficulty')}: {st.session_state.current_difficulty}")
-                st.write(f"{self.get_translated_text('interview_language')}: {st.session_state.selected_language}")
+                st.success(f"✅ {_t('resume_analyzed')}")
+                st.write(f"{_t('skills_found')}: {len(st.session_state.candidate_skills)}")
+                st.write(f"{_t('experience_level')}: {st.session_state.candidate_experience}")
+                st.write(f"{_t('current_difficulty')}: {st.session_state.current_difficulty}")
+                st.write(f"{_t('interview_language')}: {st.session_state.selected_language}")
             
             if st.session_state.interview_started:
-                st.success(f"✅ {self.get_translated_text('interview_started')}")
-                st.write(f"{self.get_translated_text('questions_generated')}: {len(st.session_state.interview_questions)}")
-                answered = len([a for a in st.session_state.candidate_answers if a.strip()])
-                st.write(f"{self.get_translated_text('answered_questions')}: {answered}/{len(st.session_state.interview_questions)}")
+                st.success(f"✅ {_t('interview_started')}")
+                st.write(f"{_t('questions_generated')}: {len(st.session_state.interview_questions)}")
+                answered = st.session_state.answered_count
+                st.write(f"{_t('answered_questions')}: {answered}/{len(st.session_state.interview_questions)}")
                 
                 # NEW: Show bias count
-                bias_count = len([r for r in st.session_state.bias_reports if r and r.get('bias_types')])
-                st.write(f"{self.get_translated_text('bias_alerts')}: {bias_count}")
+                bias_count = len(st.session_state.biased_questions)
+                st.write(f"{_t('bias_alerts')}: {bias_count}")
             
             if st.session_state.interview_completed:
-                st.success(f"✅ {self.get_translated_text('interview_completed')}")
+                st.success(f"✅ {_t('interview_completed')}")
                 if st.session_state.analytics_data:
-                    st.write(f"{self.get_translated_text('hire_confidence')}: {st.session_state.analytics_data.get('hire_confidence', 0)}%")
+                    st.write(f"{_t('hire_confidence')}: {st.session_state.analytics_data.get('hire_confidence', 0)}%")
             
             st.markdown("---")
             
-            if st.button(f"🔄 {self.get_translated_text('reset_entire_session')}", use_container_width=True, key="sidebar_reset"):
+            if st.button(f"🔄 {_t('reset_entire_session')}", use_container_width=True, key="sidebar_reset"):
                 self.reset_interview()
                 st.rerun()
             
             st.markdown("---")
-            st.markdown(f"### 💡 {self.get_translated_text('interview_tips')}")
+            st.markdown(f"### 💡 {_t('interview_tips')}")
             st.markdown("""
             - Be specific in your answers
             - Include real examples and projects
@@ -1394,8 +1832,8 @@ class FairAIHireApp:
             
             # Accessibility Note
             st.markdown("---")
-            st.markdown(f"### 🌐 {self.get_translated_text('accessibility')}")
-            st.info(self.get_translated_text('accessibility_note'))
+            st.markdown(f"### 🌐 {_t('accessibility')}")
+            st.info(_t('accessibility_note'))
 
     def display_header(self):
         """Display application header"""
@@ -1450,39 +1888,35 @@ Skills: Python, React, SQL, Teamwork, Communication""",
     
     def display_skills(self):
         """Display extracted skills in a visually appealing way"""
+        _t = self.get_translated_text
         if st.session_state.candidate_skills:
-            st.markdown(f'<div class="section-header">🎯 {self.get_translated_text("discovered_skills")}</div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="section-header">🎯 {_t("discovered_skills")}</div>', unsafe_allow_html=True)
             
             st.markdown('<div class="custom-container">', unsafe_allow_html=True)
             
             col1, col2 = st.columns(2)
             
             with col1:
-                st.markdown(f"**🔧 {self.get_translated_text('technical_skills')}**")
-                tech_skills = [skill for skill, category, confidence in st.session_state.candidate_skills if category == 'technical']
-                if tech_skills:
-                    for skill in tech_skills:
-                        st.markdown(f'<span class="skill-chip skill-chip-technical">⚡ {skill.title()}</span>', 
-                                   unsafe_allow_html=True)
+                st.markdown(f"**🔧 {_t('technical_skills')}**")
+                tech_chips = st.session_state.skill_chips['technical']
+                if tech_chips:
+                    st.markdown(tech_chips, unsafe_allow_html=True)
                 else:
-                    st.markdown(f"*{self.get_translated_text('no_technical_skills')}*")
+                    st.markdown(f"*{_t('no_technical_skills')}*")
             
             with col2:
-                st.markdown(f"**💬 {self.get_translated_text('soft_skills')}**")
-                soft_skills = [skill for skill, category, confidence in st.session_state.candidate_skills if category == 'soft']
-                if soft_skills:
-                    for skill in soft_skills:
-                        st.markdown(f'<span class="skill-chip skill-chip-soft">🌟 {skill.title()}</span>', 
-                                   unsafe_allow_html=True)
+                st.markdown(f"**💬 {_t('soft_skills')}**")
+                soft_chips = st.session_state.skill_chips['soft']
+                if soft_chips:
+                    st.markdown(soft_chips, unsafe_allow_html=True)
                 else:
-                    st.markdown(f"*{self.get_translated_text('no_soft_skills')}*")
+                    st.markdown(f"*{_t('no_soft_skills')}*")
             
             # Experience level
-            level_emojis = {'Entry': '🟢', 'Mid': '🟡', 'Senior': '🔴'}
-            emoji = level_emojis.get(st.session_state.candidate_experience, '⚪')
+            emoji = _LEVEL_EMOJIS.get(st.session_state.candidate_experience, '⚪')
             
             st.markdown(f"""
-            **📊 {self.get_translated_text('experience_level')}:** 
+            **📊 {_t('experience_level')}:** 
             <span style='font-size: 1.2rem; font-weight: bold; color: #4CAF50;'>
             {emoji} {st.session_state.candidate_experience} Level
             </span>
@@ -1490,19 +1924,26 @@ Skills: Python, React, SQL, Teamwork, Communication""",
             
             st.markdown('</div>', unsafe_allow_html=True)
 
+    @_fragment
     def skills_visualization_section(self):
         """Display skills graph visualization - FIXED VERSION"""
-        st.markdown(f'<div class="section-header">🕸️ {self.get_translated_text("skills_visualization")}</div>', unsafe_allow_html=True)
+        _t = self.get_translated_text
+        st.markdown(f'<div class="section-header">🕸️ {_t("skills_visualization")}</div>', unsafe_allow_html=True)
         
         if not st.session_state.skills_graph:
-            st.info(f"👆 {self.get_translated_text('analyze_resume_first')}")
+            st.info(f"👆 {_t('analyze_resume_first')}")
+            return
+        
+        # The charts are only built once the user asks for them, so reruns from the
+        # interview below skip this section's figures entirely
+        if not st.toggle("Show visualizations", key="show_viz"):
             return
         
         # Create tabs for different visualizations
         viz_tab1, viz_tab2, viz_tab3 = st.tabs(["Network Graph", "Category Analysis", "Confidence Heatmap"])
         
         with viz_tab1:
-            st.markdown(f"### 🕸️ {self.get_translated_text('skills_relationship_network')}")
+            st.markdown(f"### 🕸️ {_t('skills_relationship_network')}")
             st.markdown("""
             **Understanding the Network:**
             - 🔴 **Nodes** = Your skills (size = confidence level)
@@ -1512,8 +1953,8 @@ Skills: Python, React, SQL, Teamwork, Communication""",
             
             # Create network graph - FIXED: Use the safe visualization function
             try:
-                fig_network = create_skills_network(st.session_state.skills_graph)
-                st.plotly_chart(fig_network, use_container_width=True, key="skills_network_graph")
+                fig_network = self._skills_chart("skills_network_graph", create_skills_network, st.session_state.skills_graph)
+                _show_chart(fig_network, key="skills_network_graph")
             except Exception as e:
                 st.error(f"Network graph error: {str(e)}")
                 st.info("Showing simplified skills visualization instead")
@@ -1521,49 +1962,28 @@ Skills: Python, React, SQL, Teamwork, Communication""",
             
             # Show skills list with details
             st.markdown("### 📋 Detected Skills Details")
-            skills_list = []
-            for skill_name, skill_node in st.session_state.skills_graph.items():
-                # Handle both object and dictionary formats
-                if hasattr(skill_node, 'confidence'):
-                    confidence = skill_node.confidence
-                    category = skill_node.category
-                    frequency = skill_node.frequency
-                    related_count = len(skill_node.related_skills) if hasattr(skill_node, 'related_skills') else 0
-                elif isinstance(skill_node, dict):
-                    confidence = skill_node.get('confidence', 0.5)
-                    category = skill_node.get('category', 'technical')
-                    frequency = skill_node.get('frequency', 1)
-                    related_count = len(skill_node.get('related_skills', []))
-                else:
-                    confidence = 0.5
-                    category = 'technical'
-                    frequency = 1
-                    related_count = 0
-                    
-                skills_list.append({
-                    "Skill": skill_name,
-                    "Category": category,
-                    "Confidence": f"{confidence:.2f}",
-                    "Frequency": frequency,
-                    "Related Skills": related_count
-                })
+            skills_df = st.session_state.skills_df
             try:
-                if skills_list:
-                    df_skills = pd.DataFrame(skills_list)
+                if not skills_df.empty:
+                    df_skills = pd.DataFrame({
+                        "Skill": skills_df["skill"],
+                        "Category": skills_df["category"],
+                        "Confidence": skills_df["confidence"].map("{:.2f}".format),
+                        "Frequency": skills_df["frequency"],
+                        "Related Skills": skills_df["related_skills"].str.len()
+                    })
                     st.dataframe(df_skills, use_container_width=True, key="skills_dataframe")
                 else:
                     # Fallback to candidate skills
                     if st.session_state.candidate_skills:
-                        skills_list = []
-                        for skill, category, confidence in st.session_state.candidate_skills:
-                            skills_list.append({
-                                "Skill": skill,
-                                "Category": category,
-                                "Confidence": f"{confidence:.2f}",
-                                "Frequency": 1,
-                                "Related Skills": 0
-                            })
-                        df_skills = pd.DataFrame(skills_list)
+                        candidate_df = st.session_state.candidate_skills_df
+                        df_skills = pd.DataFrame({
+                            "Skill": candidate_df["skill"],
+                            "Category": candidate_df["category"],
+                            "Confidence": candidate_df["confidence"].map("{:.2f}".format),
+                            "Frequency": 1,
+                            "Related Skills": 0
+                        })
                         st.dataframe(df_skills, use_container_width=True, key="skills_dataframe_fallback")
                     else:
                         st.info("No skills data available")
@@ -1571,7 +1991,7 @@ Skills: Python, React, SQL, Teamwork, Communication""",
                 st.error(f"Skills table error: {str(e)}")
             
         with viz_tab2:
-            st.markdown(f"### 📊 {self.get_translated_text('skills_category_analysis')}")
+            st.markdown(f"### 📊 {_t('skills_category_analysis')}")
             
             col1, col2 = st.columns(2)
             
@@ -1579,8 +1999,8 @@ Skills: Python, React, SQL, Teamwork, Communication""",
                 # Category distribution
                 st.markdown("#### Skills by Category")
                 try:
-                    fig_barchart = create_category_barchart(st.session_state.skills_data)
-                    st.plotly_chart(fig_barchart, use_container_width=True, key="category_barchart")
+                    fig_barchart = self._skills_chart("category_barchart", create_category_barchart, st.session_state.skills_data)
+                    _show_chart(fig_barchart, key="category_barchart")
                 except Exception as e:
                     st.error(f"Category chart error: {str(e)}")
                     self.display_simple_category_chart()
@@ -1589,114 +2009,83 @@ Skills: Python, React, SQL, Teamwork, Communication""",
                 # Radar chart
                 st.markdown("#### Skills Radar")
                 try:
-                    fig_radar = plot_skill_categories(st.session_state.skills_data)
-                    st.plotly_chart(fig_radar, use_container_width=True, key="skills_radar")
+                    fig_radar = self._skills_chart("skills_radar", plot_skill_categories, st.session_state.skills_data)
+                    _show_chart(fig_radar, key="skills_radar")
                 except Exception as e:
                     st.error(f"Radar chart error: {str(e)}")
                     self.display_simple_radar_chart()
             
         with viz_tab3:
-            st.markdown(f"### 🔥 {self.get_translated_text('skill_confidence_heatmap')}")
+            st.markdown(f"### 🔥 {_t('skill_confidence_heatmap')}")
             try:
-                fig_heatmap = create_confidence_heatmap(st.session_state.skills_graph)
-                st.plotly_chart(fig_heatmap, use_container_width=True, key="confidence_heatmap")
+                fig_heatmap = self._skills_chart("confidence_heatmap", create_confidence_heatmap, st.session_state.skills_graph)
+                _show_chart(fig_heatmap, key="confidence_heatmap")
             except Exception as e:
                 st.error(f"Heatmap error: {str(e)}")
                 self.display_simple_heatmap()
             
             # Skills metrics
             try:
-                metrics = calculate_skill_metrics(st.session_state.skills_graph)
+                metrics = self._skills_chart("skill_metrics", calculate_skill_metrics, st.session_state.skills_graph)
             except:
                 metrics = {"total_skills": 0, "avg_confidence": 0, "total_relationships": 0, "connectivity_score": 0}
             
-            st.markdown(f"### 📈 {self.get_translated_text('skills_metrics')}")
+            st.markdown(f"### 📈 {_t('skills_metrics')}")
             col1, col2, col3, col4 = st.columns(4)
             with col1:
-                st.metric(self.get_translated_text("total_skills"), metrics['total_skills'])
+                st.metric(_t("total_skills"), metrics['total_skills'])
             with col2:
-                st.metric(self.get_translated_text("avg_confidence"), f"{metrics['avg_confidence']:.2f}")
+                st.metric(_t("avg_confidence"), f"{metrics['avg_confidence']:.2f}")
             with col3:
-                st.metric(self.get_translated_text("relationships"), metrics['total_relationships'])
+                st.metric(_t("relationships"), metrics['total_relationships'])
             with col4:
-                st.metric(self.get_translated_text("connectivity"), f"{metrics['connectivity_score']:.2f}")
+                st.metric(_t("connectivity"), f"{metrics['connectivity_score']:.2f}")
             
             # Export functionality
-            st.markdown(f"### 💾 {self.get_translated_text('export_skills_data')}")
+            st.markdown(f"### 💾 {_t('export_skills_data')}")
             if st.button("Export Skills Data as JSON", key="export_skills"):
-                skills_export = {
-                    "skills_graph": {
-                        name: {
-                            "skill": node.skill if hasattr(node, 'skill') else name,
-                            "category": node.category if hasattr(node, 'category') else 'technical',
-                            "confidence": node.confidence if hasattr(node, 'confidence') else 0.5,
-                            "frequency": node.frequency if hasattr(node, 'frequency') else 1,
-                            "related_skills": node.related_skills if hasattr(node, 'related_skills') else []
-                        } for name, node in st.session_state.skills_graph.items()
-                    },
+                # Serialized once per analysed resume; repeat clicks reuse the string
+                skills_json = self._skills_chart("skills_export_json", lambda metrics: json.dumps({
+                    "skills_graph": st.session_state.skills_df.set_index("skill", drop=False).to_dict("index"),
                     "candidate_skills": st.session_state.candidate_skills,
                     "metrics": metrics
-                }
+                }, indent=2), metrics)
                 st.download_button(
                     label="Download JSON",
-                    data=json.dumps(skills_export, indent=2),
+                    data=skills_json,
                     file_name="skills_analysis.json",
                     mime="application/json",
                     key="download_skills_json"
                 )
     
+    def _skills_chart(self, key, builder, data):
+        """Build a skills chart (or the metrics summary) once per analysed resume and reuse it on later reruns"""
+        figures = st.session_state.skills_figures
+        if key not in figures:
+            figures[key] = builder(data)
+        return figures[key]
+    
     def display_simple_skills_visualization(self):
         """Display a simple skills visualization when detailed graph is not available"""
         if not st.session_state.candidate_skills:
             st.info("No skills data available for visualization")
             return
         
-        # Create a simple bar chart of skills by confidence
-        skills = [skill[0] for skill in st.session_state.candidate_skills]
-        confidences = [skill[2] for skill in st.session_state.candidate_skills]
-        categories = [skill[1] for skill in st.session_state.candidate_skills]
-        
-        fig = go.Figure()
-        
-        # Add bars for each category with different colors
-        tech_indices = [i for i, cat in enumerate(categories) if cat == 'technical']
-        soft_indices = [i for i, cat in enumerate(categories) if cat == 'soft']
-        
-        if tech_indices:
-            fig.add_trace(go.Bar(
-                x=[skills[i] for i in tech_indices],
-                y=[confidences[i] for i in tech_indices],
-                name='Technical Skills',
-                marker_color='blue'
-            ))
-        
-        if soft_indices:
-            fig.add_trace(go.Bar(
-                x=[skills[i] for i in soft_indices],
-                y=[confidences[i] for i in soft_indices],
-                name='Soft Skills',
-                marker_color='green'
-            ))
+        # Create a simple bar chart of skills by confidence, one column per category
+        df = st.session_state.candidate_skills_df
+        chart_df = df.pivot_table(index="skill", columns="category", values="confidence", sort=False)
+        chart_df = chart_df.rename(columns={'technical': 'Technical Skills', 'soft': 'Soft Skills'})
         
-        fig.update_layout(
-            title="Skills Confidence Levels",
-            xaxis_title="Skills",
-            yaxis_title="Confidence Level",
-            barmode='group',
-            height=400
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        st.markdown("#### Skills Confidence Levels")
+        st.bar_chart(chart_df, height=400)
     
     def display_simple_category_chart(self):
         """Display a simple category chart"""
         if not st.session_state.candidate_skills:
             return
         
-        # Count skills by category
-        category_count = {}
-        for skill, category, confidence in st.session_state.candidate_skills:
-            category_count[category] = category_count.get(category, 0) + 1
+        # Skills per category are counted once when the resume is analysed
+        category_count = st.session_state.skill_category_counts
         
         fig = go.Figure(go.Pie(
             labels=list(category_count.keys()),
@@ -1716,18 +2105,8 @@ Skills: Python, React, SQL, Teamwork, Communication""",
         if not st.session_state.candidate_skills:
             return
         
-        # Calculate average confidence by category
-        category_confidences = {}
-        category_counts = {}
-        
-        for skill, category, confidence in st.session_state.candidate_skills:
-            if category not in category_confidences:
-                category_confidences[category] = 0
-                category_counts[category] = 0
-            category_confidences[category] += confidence
-            category_counts[category] += 1
-        
-        avg_confidences = {cat: conf/category_counts[cat] for cat, conf in category_confidences.items()}
+        # Average confidence by category is aggregated when the resume is analysed
+        avg_confidences = st.session_state.skill_category_confidence
         
         fig = go.Figure()
         
@@ -1756,46 +2135,34 @@ Skills: Python, React, SQL, Teamwork, Communication""",
         if not st.session_state.candidate_skills:
             return
         
-        skills = [skill[0] for skill in st.session_state.candidate_skills]
-        confidences = [[skill[2]] for skill in st.session_state.candidate_skills]
+        df = st.session_state.candidate_skills_df.assign(metric="Confidence")
         
-        fig = go.Figure(go.Heatmap(
-            z=confidences,
-            x=['Confidence'],
-            y=skills,
-            colorscale='Viridis'
-        ))
-        
-        fig.update_layout(
-            title="Skills Confidence Heatmap",
-            height=400
+        chart = alt.Chart(df, title="Skills Confidence Heatmap", height=400).mark_rect().encode(
+            x=alt.X("metric:N", title=None),
+            y=alt.Y("skill:N", title=None, sort=None),
+            color=alt.Color("confidence:Q", scale=alt.Scale(scheme="viridis")),
+            tooltip=["skill", "category", "confidence"]
         )
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.altair_chart(chart, use_container_width=True)
 
     def interview_section(self):
         """Display interview questions and answers with navigation"""
+        _t = self.get_translated_text
         if not st.session_state.interview_started or st.session_state.interview_completed:
             return
         
-        st.markdown(f'<div class="section-header">🎤 {self.get_translated_text("interview_session")}</div>', unsafe_allow_html=True)
+        st.markdown(f'<div class="section-header">🎤 {_t("interview_session")}</div>', unsafe_allow_html=True)
         
         # Language indicator
-        st.markdown(f"""
-        <div class="language-selector">
-            🌍 <strong>{self.get_translated_text('interview_language')}:</strong> {st.session_state.selected_language} 
-            | 💬 <strong>You can answer in any language</strong>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_LANGUAGE_BANNER(label=_t('interview_language'),
+                                     language=st.session_state.selected_language), unsafe_allow_html=True)
         
         # NEW: Real-time bias alert counter
-        current_biases = len([r for r in st.session_state.bias_reports if r and r.get('bias_types')])
+        current_biases = len(st.session_state.biased_questions)
         if current_biases > 0:
-            st.markdown(f"""
-            <div class="bias-alert-box">
-                <strong>🚨 {self.get_translated_text('bias_alerts')}:</strong> {current_biases} potential bias(es) detected so far
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_BIAS_ALERT_BANNER(label=_t('bias_alerts'), count=current_biases),
+                        unsafe_allow_html=True)
         
         if st.session_state.interview_questions:
             current_index = st.session_state.current_question_index
@@ -1805,14 +2172,13 @@ Skills: Python, React, SQL, Teamwork, Communication""",
             progress = (current_index) / total_questions
             st.progress(progress)
             
-            st.markdown(f"""
-            <div class='progress-text'>
-            📍 Question {current_index + 1} of {total_questions} 
-            ({int(progress * 100)}% Complete)
-            <br>📊 {self.get_translated_text('current_difficulty')}: <strong>{st.session_state.current_difficulty}</strong>
-            <br>🌐 {self.get_translated_text('interview_language')}: <strong>{st.session_state.selected_language}</strong>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_PROGRESS_TEXT(
+                number=current_index + 1, total=total_questions, percent=int(progress * 100),
+                difficulty_label=_t('current_difficulty'),
+                difficulty=st.session_state.current_difficulty,
+                language_label=_t('interview_language'),
+                language=st.session_state.selected_language
+            ), unsafe_allow_html=True)
             
             # Display question
             current_question = st.session_state.interview_questions[current_index]
@@ -1823,40 +2189,54 @@ Skills: Python, React, SQL, Teamwork, Communication""",
                 st.session_state.ai_enhanced_questions[current_index].get('success')):
                 
                 enhanced_data = st.session_state.ai_enhanced_questions[current_index]
-                st.markdown(f"""
-                <div class="ai-enhanced-box">
-                    <strong style='color: #FFD700;'>🤖 {self.get_translated_text('ai_enhanced_question')}:</strong><br>
-                    {enhanced_data['improved_question']}
-                    <br><br>
-                    <small><em>💡 {enhanced_data['explanation']}</em></small>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(_AI_ENHANCED_QUESTION(label=_t('ai_enhanced_question'),
+                                                  question=enhanced_data['improved_question'],
+                                                  explanation=enhanced_data['explanation']), unsafe_allow_html=True)
             else:
-                st.markdown(f"""
-                <div class="question-box">
-                    <strong style='color: #4FC3F7;'>💡 {self.get_translated_text('questions_generated')}:</strong><br>
-                    {current_question}
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(_QUESTION_BOX(label=_t('questions_generated'),
+                                          question=current_question), unsafe_allow_html=True)
             
-            # Answer input area with Audio/Video option
-            st.markdown(f"**{self.get_translated_text('your_answer')}**")
+            # Answer input area with Audio/Video option. One text area serves every
+            # question; it is loaded with the stored answer when the question changes
+            st.markdown(f"**{_t('your_answer')}**")
+            if st.session_state.answer_input_index != current_index:
+                st.session_state.answer_input = st.session_state.candidate_answers[current_index]
+                st.session_state.answer_input_index = current_index
             
             # NEW: Audio/Video recording option
             if st.session_state.audio_video_enabled:
-                av_col1, av_col2 = st.columns([3, 1])
-                
-                with av_col1:
-                    answer = st.text_area(
-                        " ",
-                        value=st.session_state.candidate_answers[current_index],
-                        height=180,
-                        placeholder="Share your experience and thoughts here... You can answer in any language.",
-                        key=f"answer_{current_index}",
-                        label_visibility="collapsed"
-                    )
+                form_col, av_col = st.columns([3, 1])
+            else:
+                form_col, av_col = nullcontext(), None
+            
+            # The answer and the navigation buttons share a form, so typing does not rerun
+            # the script; the answer is stored when a navigation button submits it.
+            # Submit buttons are keyed by their form, and the form key changes per
+            # question: st.rerun() does not reset button triggers, so a stable key would
+            # fire the click again on the next question
+            with form_col, st.form(f"answer_form_{current_index}"):
+                answer = st.text_area(
+                    " ",
+                    height=180,
+                    placeholder="Share your experience and thoughts here... You can answer in any language.",
+                    key="answer_input",
+                    label_visibility="collapsed"
+                )
                 
-                with av_col2:
+                # Next saves the answer on the way, so there is no separate save button
+                col1, col2 = st.columns(2)
+                with col1:
+                    go_previous = current_index > 0 and st.form_submit_button(
+                        f"⬅️ {_t('previous_question')}", use_container_width=True)
+                with col2:
+                    is_last = current_index == total_questions - 1
+                    go_next = st.form_submit_button(
+                        f"🏁 {_t('complete_interview')}" if is_last
+                        else f"💾 {_t('next_question')} ➡️",
+                        type="primary", use_container_width=True)
+            
+            if av_col is not None:
+                with av_col:
                     st.markdown("<div class='av-controls'>", unsafe_allow_html=True)
                     st.write("🎤🎥 Audio/Video Options")
                     
@@ -1864,26 +2244,31 @@ Skills: Python, React, SQL, Teamwork, Communication""",
                         "Recording Mode:",
                         ["Text Only", "Record Audio/Video"],
                         horizontal=True,
-                        key=f"rec_mode_{current_index}"
+                        key="rec_mode"
                     )
                     
                     if recording_mode == "Record Audio/Video":
                         rec_col1, rec_col2 = st.columns(2)
                         
                         with rec_col1:
-                            if st.button("🎤 Start Recording", type="primary", key=f"record_{current_index}") and not st.session_state.recording_in_progress:
+                            st.button("🎤 Start Recording", type="primary", key="record_answer",
+                                      on_click=_request_recording)
+                            if st.session_state.recording_requested and not st.session_state.recording_in_progress:
+                                st.session_state.recording_requested = False
                                 st.session_state.recording_in_progress = True
                                 with st.spinner("🎥 Recording in progress..."):
                                     # Use real-time recording for better transcription
                                     transcription, audio_path, video_path = self.realtime_av_processor.start_realtime_recording(duration=30)
                                     
                                     if transcription and transcription.strip():
-                                        st.session_state.candidate_answers[current_index] = transcription
+                                        self._set_answer(current_index, transcription)
+                                        # Reload the text area with the transcription on the rerun
+                                        st.session_state.answer_input_index = None
                                         st.session_state.last_audio_path = audio_path
                                         st.session_state.last_video_path = video_path
-                                        st.success(f"✅ Transcription: {transcription}")
+                                        st.session_state.recording_notice = ("success", f"✅ Transcription: {transcription}")
                                     else:
-                                        st.warning("⚠️ No speech detected. Please try again.")
+                                        st.session_state.recording_notice = ("warning", "⚠️ No speech detected. Please try again.")
                                 
                                 st.session_state.recording_in_progress = False
                                 st.rerun()
@@ -1891,26 +2276,31 @@ Skills: Python, React, SQL, Teamwork, Communication""",
                         with rec_col2:
                             if st.session_state.recording_in_progress:
                                 st.markdown("<div class='recording-active'>🔴 Recording...</div>", unsafe_allow_html=True)
+                        
+                        # The recording ends in st.rerun(), so its outcome is shown on the run after it
+                        if st.session_state.recording_notice:
+                            level, message = st.session_state.recording_notice
+                            st.session_state.recording_notice = None
+                            getattr(st, level)(message)
                     
                     st.markdown("</div>", unsafe_allow_html=True)
-                
-                # Update answer in session state as user types
-                if answer != st.session_state.candidate_answers[current_index]:
-                    st.session_state.candidate_answers[current_index] = answer
-            else:
-                # Standard text input without audio/video
-                answer = st.text_area(
-                    " ",
-                    value=st.session_state.candidate_answers[current_index],
-                    height=180,
-                    placeholder="Share your experience and thoughts here... You can answer in any language.",
-                    key=f"answer_{current_index}",
-                    label_visibility="collapsed"
-                )
-                
-                # Update answer in session state as user types
-                if answer != st.session_state.candidate_answers[current_index]:
-                    st.session_state.candidate_answers[current_index] = answer
+            
+            if go_previous:
+                self._set_answer(current_index, answer)
+                self.navigate_questions("previous")
+                st.rerun()
+            
+            # submit_answer stores the answer itself and refuses a blank one, so an empty
+            # answer blocks moving on the same way it blocks completing the interview
+            if go_next:
+                if not self.submit_answer(answer, current_index):
+                    st.error("Please provide an answer before saving.")
+                elif not is_last:
+                    self.navigate_questions("next")
+                    st.rerun()
+                else:
+                    st.session_state.completion_notice = True
+                    self.complete_interview()
             
             # Display AI analysis of previous answer if available
             if (current_index > 0 and 
@@ -1919,152 +2309,104 @@ Skills: Python, React, SQL, Teamwork, Communication""",
                 
                 analysis = st.session_state.answer_analysis[current_index-1]
                 if analysis.get('success'):
-                    st.markdown(f"""
-                    <div class="ai-analysis-box">
-                        <strong>🤖 {self.get_translated_text('ai_analysis_previous_answer')}:</strong><br>
-                        <strong>{self.get_translated_text('quality_score_label')}:</strong> {analysis.get('quality_score', 'N/A')}/10<br>
-                        <strong>{self.get_translated_text('strengths_label')}:</strong> {', '.join(analysis.get('strengths', []))}<br>
-                        <strong>{self.get_translated_text('skills_demonstrated')}:</strong> {', '.join(analysis.get('skills_demonstrated', []))}
-                    </div>
-                    """, unsafe_allow_html=True)
-            
-            # Navigation and action buttons
-            col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
-            
-            with col1:
-                if current_index > 0:
-                    if st.button(f"⬅️ {self.get_translated_text('previous_question')}", use_container_width=True, key=f"prev_{current_index}"):
-                        self.navigate_questions("previous")
-                        st.rerun()
-            
-            with col2:
-                if st.button(f"💾 {self.get_translated_text('save_answer')}", use_container_width=True, key=f"save_{current_index}"):
-                    if self.submit_answer(answer, current_index):
-                        st.success("✅ Answer saved!")
-                    else:
-                        st.error("Please provide an answer before saving.")
-            
-            with col3:
-                if current_index < total_questions - 1:
-                    if st.button(f"{self.get_translated_text('next_question')} ➡️", type="primary", use_container_width=True, key=f"next_{current_index}"):
-                        self.submit_answer(answer, current_index)
-                        self.navigate_questions("next")
-                        st.rerun()
-                else:
-                    if st.button(f"🏁 {self.get_translated_text('complete_interview')}", type="primary", use_container_width=True, key="complete_interview"):
-                        if self.submit_answer(answer, current_index):
-                            self.complete_interview()
-                            st.balloons()
-                            st.success("🎊 Interview completed! Check the summary tab.")
-                            st.rerun()
-            
-            with col4:
-                if st.button("🔄 Restart", use_container_width=True, key=f"restart_{current_index}"):
-                    self.reset_interview()
-                    st.rerun()
+                    st.markdown(_AI_ANALYSIS_BOX(
+                        label=_t('ai_analysis_previous_answer'),
+                        score_label=_t('quality_score_label'),
+                        score=analysis.get('quality_score', 'N/A'),
+                        strengths_label=_t('strengths_label'),
+                        strengths=', '.join(analysis.get('strengths', [])),
+                        skills_label=_t('skills_demonstrated'),
+                        skills=', '.join(analysis.get('skills_demonstrated', []))
+                    ), unsafe_allow_html=True)
+            
+            # Restart needs no answer, so it stays outside the form. reset_interview clears
+            # the widget state as well, so the click cannot carry over into the next interview
+            if st.button("🔄 Restart", key="restart_interview"):
+                self.reset_interview()
+                st.rerun()
 
     def display_fairness_dashboard(self):
         """Display comprehensive fairness dashboard with visual analytics"""
         st.markdown(f'<div class="section-header">📊 {self.get_translated_text("fairness_dashboard")}</div>', unsafe_allow_html=True)
         
+        # NEW: Generate comprehensive bias report
+        bias_report = _bias_report(st.session_state.interview_data)
+        
+        self._render_summary_cards(bias_report)
+        self._render_advanced_analytics(bias_report)
+        self._render_hotspots(bias_report)
+        self._render_tabs()
+        self._render_export()
+
+    def _render_summary_cards(self, bias_report):
+        """Overall metric cards at the top of the fairness dashboard"""
+        _t = self.get_translated_text
+        
         # Calculate metrics
         skills_match_score = self.calculate_skills_match_score()
         bias_alert_level, bias_color = self.calculate_bias_alert_level()
         completeness_score = self.calculate_interview_completeness()
         fairness_score = self.calculate_overall_fairness_score()
         
-        # NEW: Generate comprehensive bias report
-        bias_report = generate_bias_report(st.session_state.interview_data)
+        alert_emoji = {"Low": "🟢", "Medium": "🟡", "High": "🔴"}.get(bias_alert_level, "⚪")
+        score_color = "#28a745" if fairness_score >= 7 else "#ffc107" if fairness_score >= 5 else "#dc3545"
+        bias_score = bias_report.get('overall_score', 100)
+        grade = bias_report.get('grade', 'A+')
         
         # Overall Metrics Row
-        col1, col2, col3, col4, col5 = st.columns(5)
-        
-        with col1:
-            st.markdown(f"""
-            <div class="summary-card" style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);">
-                <h3>🎯 {self.get_translated_text('overall_match')}</h3>
-                <h2>{skills_match_score}%</h2>
-                <p>{self.get_translated_text('job_requirement_fit')}</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            alert_emoji = {"Low": "🟢", "Medium": "🟡", "High": "🔴"}.get(bias_alert_level, "⚪")
-            st.markdown(f"""
-            <div class="summary-card" style="background: linear-gradient(135deg, {bias_color} 0%, #e83e8c 100%);">
-                <h3>⚠️ {self.get_translated_text('bias_alerts')}</h3>
-                <h2>{alert_emoji} {bias_alert_level}</h2>
-                <p>{self.get_translated_text('fairness')}</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"""
-            <div class="summary-card" style="background: linear-gradient(135deg, #28a745 0%, #20c997 100%);">
-                <h3>📈 {self.get_translated_text('completeness')}</h3>
-                <h2>{completeness_score}%</h2>
-                <p>{self.get_translated_text('interview_progress')}</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            score_color = "#28a745" if fairness_score >= 7 else "#ffc107" if fairness_score >= 5 else "#dc3545"
-            st.markdown(f"""
-            <div class="summary-card" style="background: linear-gradient(135deg, {score_color} 0%, #fd7e14 100%);">
-                <h3>⚖️ {self.get_translated_text('fairness_score')}</h3>
-                <h2>{fairness_score}/10</h2>
-                <p>{self.get_translated_text('overall_rating')}</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col5:
-            # NEW: Bias Score Gauge
-            bias_score = bias_report.get('overall_score', 100)
-            grade = bias_report.get('grade', 'A+')
-            st.markdown(f"""
-            <div class="summary-card" style="background: linear-gradient(135deg, #6f42c1 0%, #e83e8c 100%);">
-                <h3>📊 {self.get_translated_text('bias_score')}</h3>
-                <h2>{bias_score}% {grade}</h2>
-                <p>{self.get_translated_text('fairness_grade')}</p>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown(_summary_cards((
+            ("#667eea", "#764ba2", "🎯", _t('overall_match'), f"{skills_match_score}%", _t('job_requirement_fit')),
+            (bias_color, "#e83e8c", "⚠️", _t('bias_alerts'), f"{alert_emoji} {bias_alert_level}", _t('fairness')),
+            ("#28a745", "#20c997", "📈", _t('completeness'), f"{completeness_score}%", _t('interview_progress')),
+            (score_color, "#fd7e14", "⚖️", _t('fairness_score'), f"{fairness_score}/10", _t('overall_rating')),
+            ("#6f42c1", "#e83e8c", "📊", _t('bias_score'), f"{bias_score}% {grade}", _t('fairness_grade')),
+        )), unsafe_allow_html=True)
+
+    def _render_advanced_analytics(self, bias_report):
+        """Bias heatmap, timeline, category distribution and severity gauge"""
+        _t = self.get_translated_text
+        bias_score = bias_report.get('overall_score', 100)
         
         # NEW: Enhanced Visual Analytics Section
-        st.markdown(f"### 📊 {self.get_translated_text('advanced_bias_analytics')}")
+        st.markdown(f"### 📊 {_t('advanced_bias_analytics')}")
         
         # Row 1: Heatmap and Timeline
         col1, col2 = st.columns(2)
         
         with col1:
-            st.markdown(f"#### 🔥 {self.get_translated_text('real_time_bias_heatmap')}")
-            heatmap_fig = self.heatmap_generator.generate_bias_heatmap(st.session_state.interview_data)
+            st.markdown(f"#### 🔥 {_t('real_time_bias_heatmap')}")
+            heatmap_fig = _bias_heatmap_figure(self.heatmap_generator, st.session_state.interview_data)
             st.plotly_chart(heatmap_fig, use_container_width=True, key="enhanced_bias_heatmap")
         
         with col2:
-            st.markdown(f"#### 📈 {self.get_translated_text('bias_detection_timeline')}")
+            st.markdown(f"#### 📈 {_t('bias_detection_timeline')}")
             if len(st.session_state.bias_history) > 1:
-                timeline_fig = self.heatmap_generator.generate_timeline_heatmap(st.session_state.bias_history)
+                timeline_fig = _bias_timeline_figure(self.heatmap_generator, st.session_state.bias_history)
                 st.plotly_chart(timeline_fig, use_container_width=True, key="bias_timeline")
             else:
-                st.info(self.get_translated_text("complete_more_questions"))
+                st.info(_t("complete_more_questions"))
         
         # Row 2: Category Distribution and Severity Gauge
         col3, col4 = st.columns(2)
         
         with col3:
-            st.markdown(f"#### 🎯 {self.get_translated_text('bias_category_distribution')}")
-            category_fig = self.heatmap_generator.generate_category_distribution(
-                bias_report.get('category_breakdown', {})
+            st.markdown(f"#### 🎯 {_t('bias_category_distribution')}")
+            category_fig = _bias_category_figure(
+                self.heatmap_generator, tuple(bias_report.get('category_breakdown', {}).items())
             )
             st.plotly_chart(category_fig, use_container_width=True, key="bias_categories")
         
         with col4:
-            st.markdown(f"#### 📊 {self.get_translated_text('overall_bias_score')}")
-            gauge_fig = self.heatmap_generator.generate_severity_gauge(bias_score)
+            st.markdown(f"#### 📊 {_t('overall_bias_score')}")
+            gauge_fig = _bias_gauge_figure(self.heatmap_generator, bias_score)
             st.plotly_chart(gauge_fig, use_container_width=True, key="bias_gauge")
+
+    def _render_hotspots(self, bias_report):
+        """Bias hotspots and improvement recommendations"""
+        _t = self.get_translated_text
         
         # NEW: Bias Hotspots Section
-        st.markdown(f"### 🚨 {self.get_translated_text('bias_hotspots_recommendations')}")
+        st.markdown(f"### 🚨 {_t('bias_hotspots_recommendations')}")
         
         hotspots = bias_report.get('trend_analysis', {}).get('hotspots', [])
         if hotspots:
@@ -2073,21 +2415,25 @@ Skills: Python, React, SQL, Teamwork, Communication""",
             # Display recommendations
             recommendations = bias_report.get('recommendations', [])
             if recommendations:
-                st.markdown(f"#### 💡 {self.get_translated_text('improvement_recommendations')}:")
+                st.markdown(f"#### 💡 {_t('improvement_recommendations')}:")
                 for rec in recommendations:
                     st.success(f"✅ {rec}")
         else:
             st.success("🎉 Excellent! No significant bias hotspots detected in this interview.")
+
+    def _render_tabs(self):
+        """Detailed breakdown tabs of the fairness dashboard"""
+        _t = self.get_translated_text
         
         # Detailed Breakdown Section
-        st.markdown(f"### 📋 {self.get_translated_text('detailed_analysis')}")
+        st.markdown(f"### 📋 {_t('detailed_analysis')}")
         
         tab1, tab2, tab3, tab4, tab5 = st.tabs([
-            f"🔍 {self.get_translated_text('skills_analysis')}",
-            f"⚠️ {self.get_translated_text('bias_analysis')}",
-            f"📊 {self.get_translated_text('performance_analysis')}",
-            f"🤖 {self.get_translated_text('ai_insights')}",
-            f"💡 {self.get_translated_text('recommendations')}"
+            f"🔍 {_t('skills_analysis')}",
+            f"⚠️ {_t('bias_analysis')}",
+            f"📊 {_t('performance_analysis')}",
+            f"🤖 {_t('ai_insights')}",
+            f"💡 {_t('recommendations')}"
         ])
         
         with tab1:
@@ -2104,16 +2450,23 @@ Skills: Python, React, SQL, Teamwork, Communication""",
         
         with tab5:
             self.display_recommendations()
+
+    # Only the export buttons are interactive, so clicking them reruns this
+    # section alone instead of the whole dashboard and its charts
+    @_fragment
+    def _render_export(self):
+        """Full report generation and download"""
+        _t = self.get_translated_text
         
         # Export Functionality
-        st.markdown(f"### 📤 {self.get_translated_text('export_analysis')}")
+        st.markdown(f"### 📤 {_t('export_analysis')}")
         col1, col2 = st.columns(2)
         
         with col1:
-            if st.button(f"📄 {self.get_translated_text('generate_full_report')}", use_container_width=True, key="generate_report"):
+            if st.button(f"📄 {_t('generate_full_report')}", use_container_width=True, key="generate_report"):
                 report = self.generate_fairness_report()
                 st.download_button(
-                    label=f"📥 {self.get_translated_text('download_report')}",
+                    label=f"📥 {_t('download_report')}",
                     data=report,
                     file_name=f"fairness_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
                     mime="text/plain",
@@ -2122,102 +2475,66 @@ Skills: Python, React, SQL, Teamwork, Communication""",
                 )
         
         with col2:
-            if st.button(f"🔄 {self.get_translated_text('start_interview')}", type="primary", use_container_width=True, key="new_interview"):
+            if st.button(f"🔄 {_t('start_interview')}", type="primary", use_container_width=True, key="new_interview"):
                 self.reset_interview()
                 st.rerun()
 
     def calculate_skills_match_score(self):
         """Calculate how well candidate skills match typical job requirements"""
-        if not st.session_state.candidate_skills:
-            return 0
-        
-        target_technical_skills = ['python', 'java', 'javascript', 'sql', 'html', 'css', 'react', 'node.js']
-        target_soft_skills = ['communication', 'teamwork', 'leadership', 'problem solving', 'creativity']
-        
-        candidate_tech_skills = [skill for skill, category, _ in st.session_state.candidate_skills if category == 'technical']
-        candidate_soft_skills = [skill for skill, category, _ in st.session_state.candidate_skills if category == 'soft']
-        
-        tech_match = len([skill for skill in candidate_tech_skills if skill in target_technical_skills])
-        soft_match = len([skill for skill in candidate_soft_skills if skill in target_soft_skills])
-        
-        tech_score = (tech_match / len(target_technical_skills)) * 70 if target_technical_skills else 0
-        soft_score = (soft_match / len(target_soft_skills)) * 30 if target_soft_skills else 0
-        
-        return min(100, int(tech_score + soft_score))
+        return st.session_state.skills_match_score
 
     def calculate_bias_alert_level(self):
         """Calculate overall bias alert level"""
-        if not st.session_state.bias_reports:
-            return "Low", "#28a745"
-        
-        high_bias_count = 0
-        medium_bias_count = 0
-        
-        for report in st.session_state.bias_reports:
-            if report and report.get('severity') == 'High':
-                high_bias_count += 1
-            elif report and report.get('severity') == 'Medium':
-                medium_bias_count += 1
-        
-        if high_bias_count > 0:
-            return "High", "#dc3545"
-        elif medium_bias_count > 1:
-            return "Medium", "#ffc107"
-        else:
-            return "Low", "#28a745"
+        bias_counts = st.session_state.bias_counts
+        return _bias_alert_level(bias_counts['High'], bias_counts['Medium'])
 
     def calculate_interview_completeness(self):
         """Calculate interview completion percentage"""
-        if not st.session_state.interview_questions:
-            return 0
-        
-        answered = len([answer for answer in st.session_state.candidate_answers if answer.strip()])
-        total = len(st.session_state.interview_questions)
-        
-        return int((answered / total) * 100) if total > 0 else 0
+        return _interview_completeness(st.session_state.answered_count,
+                                       len(st.session_state.interview_questions))
+
+    def calculate_interview_duration(self):
+        """Calculate elapsed interview time in seconds (None until completed)"""
+        interview_data = st.session_state.interview_data
+        start_ns = interview_data.get('start_ns')
+        end_ns = interview_data.get('end_ns')
+        if start_ns is None or end_ns is None:
+            return None
+        
+        return (end_ns - start_ns) / 1e9
 
     def calculate_overall_fairness_score(self):
         """Calculate overall fairness score (1-10)"""
         bias_alert_level, _ = self.calculate_bias_alert_level()
-        completeness = self.calculate_interview_completeness()
-        
-        bias_scores = {"Low": 9, "Medium": 6, "High": 3}
-        base_score = bias_scores.get(bias_alert_level, 5)
-        
-        completeness_factor = completeness / 100.0
-        
-        return min(10, int(base_score + (completeness_factor * 2)))
+        return _overall_fairness_score(bias_alert_level, self.calculate_interview_completeness())
 
     def display_skills_analysis(self):
         """Display detailed skills analysis"""
-        st.markdown(f"#### 🎯 {self.get_translated_text('skills_identified')}")
+        _t = self.get_translated_text
+        st.markdown(f"#### 🎯 {_t('skills_identified')}")
         
         if st.session_state.candidate_skills:
             col1, col2 = st.columns(2)
             
             with col1:
-                st.markdown(f"**{self.get_translated_text('technical_skills')}:**")
-                tech_skills = [skill for skill, category, _ in st.session_state.candidate_skills if category == 'technical']
-                if tech_skills:
-                    for skill in tech_skills:
-                        st.markdown(f'<span class="skill-chip skill-chip-technical">⚡ {skill.title()}</span>', 
-                                   unsafe_allow_html=True)
+                st.markdown(f"**{_t('technical_skills')}:**")
+                tech_chips = st.session_state.skill_chips['technical']
+                if tech_chips:
+                    st.markdown(tech_chips, unsafe_allow_html=True)
                 else:
-                    st.write(self.get_translated_text("no_technical_skills"))
+                    st.write(_t("no_technical_skills"))
             
             with col2:
-                st.markdown(f"**{self.get_translated_text('soft_skills')}:**")
-                soft_skills = [skill for skill, category, _ in st.session_state.candidate_skills if category == 'soft']
-                if soft_skills:
-                    for skill in soft_skills:
-                        st.markdown(f'<span class="skill-chip skill-chip-soft">🌟 {skill.title()}</span>', 
-                                   unsafe_allow_html=True)
+                st.markdown(f"**{_t('soft_skills')}:**")
+                soft_chips = st.session_state.skill_chips['soft']
+                if soft_chips:
+                    st.markdown(soft_chips, unsafe_allow_html=True)
                 else:
-                    st.write(self.get_translated_text("no_soft_skills"))
+                    st.write(_t("no_soft_skills"))
             
-            st.metric(self.get_translated_text("total_skills"), len(st.session_state.candidate_skills))
+            st.metric(_t("total_skills"), len(st.session_state.candidate_skills))
         else:
-            st.info(self.get_translated_text("no_skills_detected"))
+            st.info(_t("no_skills_detected"))
 
     def display_bias_analysis(self):
         """Display detailed bias analysis"""
@@ -2227,21 +2544,17 @@ Skills: Python, React, SQL, Teamwork, Communication""",
             st.success(f"✅ {self.get_translated_text('excellent_no_biases')}")
             return
         
-        bias_count = 0
-        for i, (question, answer, bias_report) in enumerate(zip(
-            st.session_state.interview_questions,
-            st.session_state.candidate_answers,
-            st.session_state.bias_reports
-        )):
-            if bias_report and bias_report.get('bias_types'):
-                bias_count += 1
-                with st.expander(f"🚩 Question {i+1}: Potential Bias Detected", expanded=False):
-                    st.write(f"**Question:** {question}")
-                    st.write(f"**Answer:** {answer}")
-                    st.write(f"**Bias Types:** {', '.join(bias_report['bias_types'])}")
-                    st.write(f"**Severity:** {bias_report.get('severity', 'Unknown')}")
-        
-        if bias_count == 0:
+        # Only the flagged questions are visited, in question order
+        biased_questions = st.session_state.biased_questions
+        for i in sorted(biased_questions):
+            row = st.session_state.qna_rows[i]
+            with st.expander(f"🚩 Question {i+1}: Potential Bias Detected", expanded=False):
+                st.write(f"**Question:** {row.question}")
+                st.write(f"**Answer:** {row.answer}")
+                st.write(f"**Bias Types:** {', '.join(row.bias['bias_types'])}")
+                st.write(f"**Severity:** {row.bias.get('severity', 'Unknown')}")
+        
+        if not biased_questions:
             st.success(f"✅ {self.get_translated_text('no_significant_biases')}")
 
     def display_performance_analysis(self):
@@ -2256,7 +2569,7 @@ Skills: Python, React, SQL, Teamwork, Communication""",
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            avg_score = sum(st.session_state.answer_scores) / len(st.session_state.answer_scores)
+            avg_score = fmean(st.session_state.answer_scores)
             st.metric(self.get_translated_text("quality_score"), f"{avg_score:.1f}/10")
         
         with col2:
@@ -2269,68 +2582,31 @@ Skills: Python, React, SQL, Teamwork, Communication""",
         # Score progression chart
         if len(st.session_state.answer_scores) > 1:
             st.markdown("#### 📈 Answer Quality Progression")
-            fig = go.Figure()
-            
-            fig.add_trace(go.Scatter(
-                x=list(range(1, len(st.session_state.answer_scores) + 1)),
-                y=st.session_state.answer_scores,
-                mode='lines+markers',
-                name='Answer Quality',
-                line=dict(color='#1f77b4', width=3),
-                marker=dict(size=8)
-            ))
-            
-            # Add difficulty level zones
-            difficulty_zones = {
-                'Easy': (0, 4, 'rgba(40, 167, 69, 0.1)'),
-                'Medium': (4, 7, 'rgba(255, 193, 7, 0.1)'),
-                'Hard': (7, 9, 'rgba(253, 126, 20, 0.1)'),
-                'Expert': (9, 11, 'rgba(220, 53, 69, 0.1)')
-            }
-            
-            for level, (low, high, color) in difficulty_zones.items():
-                fig.add_hrect(
-                    y0=low, y1=high,
-                    fillcolor=color,
-                    opacity=0.3,
-                    line_width=0,
-                    annotation_text=level,
-                    annotation_position="inside top left"
-                )
-            
-            fig.update_layout(
-                title="Answer Quality Progression with Difficulty Zones",
-                xaxis_title="Question Number",
-                yaxis_title="Quality Score (1-10)",
-                height=400,
-                showlegend=False
-            )
-            
+            fig = _score_progression_figure(tuple(st.session_state.answer_scores))
             st.plotly_chart(fig, use_container_width=True, key="performance_chart")
 
     def display_ai_insights(self):
         """Display AI-powered insights and analysis"""
-        st.markdown(f"#### 🤖 {self.get_translated_text('ai_powered_insights')}")
+        _t = self.get_translated_text
+        st.markdown(f"#### 🤖 {_t('ai_powered_insights')}")
         
         if not st.session_state.ai_enabled or not self.ai_enhancer.available:
-            st.info(self.get_translated_text("enable_ai_for_insights"))
+            st.info(_t("enable_ai_for_insights"))
             return
         
         if not st.session_state.answer_analysis or all(analysis is None for analysis in st.session_state.answer_analysis):
-            st.info(self.get_translated_text("complete_for_ai_analysis"))
+            st.info(_t("complete_for_ai_analysis"))
             return
         
         # Overall AI Analysis
-        total_answers = len([a for a in st.session_state.candidate_answers if a.strip()])
+        total_answers = st.session_state.answered_count
         if total_answers > 0:
-            quality_scores = []
-            for analysis in st.session_state.answer_analysis:
-                if analysis and analysis.get('quality_score'):
-                    quality_scores.append(analysis['quality_score'])
-            
-            if quality_scores:
-                avg_quality = sum(quality_scores) / len(quality_scores)
-                st.metric(f"📊 {self.get_translated_text('answer_quality_score')}", f"{avg_quality:.1f}/10")
+            quality_scores = [analysis['quality_score'] for analysis in st.session_state.answer_analysis
+                              if analysis and analysis.get('quality_score')]
+            avg_quality = fmean(quality_scores) if quality_scores else None
+            
+            if avg_quality is not None:
+                st.metric(f"📊 {_t('answer_quality_score')}", f"{avg_quality:.1f}/10")
                 
                 if avg_quality >= 8:
                     st.success("🎉 Excellent! Your answers demonstrate strong experience and clarity.")
@@ -2340,13 +2616,10 @@ Skills: Python, React, SQL, Teamwork, Communication""",
                     st.warning("💡 Consider providing more specific examples and details in your answers.")
         
         # Detailed answer analysis
-        st.markdown(f"#### 📝 {self.get_translated_text('answer_by_answer_analysis')}")
-        for i, (question, answer, analysis) in enumerate(zip(
-            st.session_state.interview_questions,
-            st.session_state.candidate_answers,
-            st.session_state.answer_analysis
-        )):
-            if answer.strip() and analysis and analysis.get('success'):
+        st.markdown(f"#### 📝 {_t('answer_by_answer_analysis')}")
+        answered_mask = st.session_state.answered_mask
+        for i, (question, answer, _, analysis, _) in enumerate(st.session_state.qna_rows):
+            if answered_mask[i] and analysis and analysis.get('success'):
                 with st.expander(f"Question {i+1} Analysis", expanded=False):
                     col1, col2 = st.columns([2, 1])
                     
@@ -2355,22 +2628,25 @@ Skills: Python, React, SQL, Teamwork, Communication""",
                         st.info(answer)
                     
                     with col2:
-                        st.metric(self.get_translated_text("quality_score_label"), f"{analysis.get('quality_score', 'N/A')}/10")
-                        st.metric(self.get_translated_text("relevance"), f"{analysis.get('relevance_score', 'N/A')}/10")
+                        st.metric(_t("quality_score_label"), f"{analysis.get('quality_score', 'N/A')}/10")
+                        st.metric(_t("relevance"), f"{analysis.get('relevance_score', 'N/A')}/10")
                     
-                    st.markdown(f"**{self.get_translated_text('strengths_label')}:**")
-                    for strength in analysis.get('strengths', []):
-                        st.write(f"✅ {strength}")
+                    # One markdown element per list, like the skill chips below
+                    st.markdown(f"**{_t('strengths_label')}:**")
+                    strengths = analysis.get('strengths', [])
+                    if strengths:
+                        st.markdown("\n\n".join(f"✅ {strength}" for strength in strengths))
                     
                     st.markdown("**Areas for Improvement:**")
-                    for improvement in analysis.get('improvements', []):
-                        st.write(f"📝 {improvement}")
+                    improvements = analysis.get('improvements', [])
+                    if improvements:
+                        st.markdown("\n\n".join(f"📝 {improvement}" for improvement in improvements))
                     
-                    st.markdown(f"**{self.get_translated_text('skills_demonstrated')}:**")
+                    st.markdown(f"**{_t('skills_demonstrated')}:**")
                     skills = analysis.get('skills_demonstrated', [])
                     if skills:
-                        for skill in skills:
-                            st.markdown(f'<span class="skill-chip">🎯 {skill}</span>', unsafe_allow_html=True)
+                        st.markdown("".join(map(_CHIP_PLAIN, skills)),
+                                   unsafe_allow_html=True)
                     else:
                         st.write("No specific skills identified in this answer.")
 
@@ -2401,159 +2677,116 @@ Skills: Python, React, SQL, Teamwork, Communication""",
 
     def generate_fairness_report(self):
         """Generate a comprehensive fairness report"""
-        # NEW: Generate comprehensive bias report
-        bias_report = generate_bias_report(st.session_state.interview_data)
-        
-        report_lines = []
-        report_lines.append("=" * 60)
-        report_lines.append("           FAIRAI HIRE - FAIRNESS REPORT")
-        report_lines.append("=" * 60)
-        report_lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report_lines.append("")
-        
-        # Summary Metrics
-        report_lines.append("SUMMARY METRICS:")
-        report_lines.append(f"  • Skills Match Score: {self.calculate_skills_match_score()}%")
-        report_lines.append(f"  • Bias Alert Level: {self.calculate_bias_alert_level()[0]}")
-        report_lines.append(f"  • Interview Completeness: {self.calculate_interview_completeness()}%")
-        report_lines.append(f"  • Overall Fairness Score: {self.calculate_overall_fairness_score()}/10")
-        report_lines.append(f"  • Final Difficulty Level: {st.session_state.current_difficulty}")
-        report_lines.append(f"  • Bias Detection Score: {bias_report.get('overall_score', 100)}% ({bias_report.get('grade', 'A+')})")
-        report_lines.append("")
-        
-        # Skills Analysis
-        report_lines.append("SKILLS ANALYSIS:")
-        if st.session_state.candidate_skills:
-            tech_skills = [skill for skill, category, _ in st.session_state.candidate_skills if category == 'technical']
-            soft_skills = [skill for skill, category, _ in st.session_state.candidate_skills if category == 'soft']
-            report_lines.append(f"  • Technical Skills: {', '.join(tech_skills) if tech_skills else 'None'}")
-            report_lines.append(f"  • Soft Skills: {', '.join(soft_skills) if soft_skills else 'None'}")
-        else:
-            report_lines.append("  • No skills data available")
-        report_lines.append("")
-        
-        # Bias Analysis
-        report_lines.append("BIAS ANALYSIS:")
-        bias_count = 0
-        for i, (question, bias_report_item) in enumerate(zip(st.session_state.interview_questions, st.session_state.bias_reports)):
-            if bias_report_item and bias_report_item.get('bias_types'):
-                bias_count += 1
-                report_lines.append(f"  • Question {i+1}: {', '.join(bias_report_item['bias_types'])}")
-        
-        if bias_count == 0:
-            report_lines.append("  • No biases detected - Excellent!")
-        
-        # Bias Hotspots
-        hotspots = bias_report.get('trend_analysis', {}).get('hotspots', [])
-        if hotspots:
-            report_lines.append(f"  • Bias Hotspots: {', '.join(hotspots)}")
-        report_lines.append("")
-        
-        # Performance Analysis
-        report_lines.append("PERFORMANCE ANALYSIS:")
-        if st.session_state.answer_scores:
-            avg_score = sum(st.session_state.answer_scores) / len(st.session_state.answer_scores)
-            report_lines.append(f"  • Average Answer Quality: {avg_score:.1f}/10")
-            report_lines.append(f"  • Questions Answered: {len([a for a in st.session_state.candidate_answers if a.strip()])}")
-        report_lines.append("")
-        
-        # Recommendations
-        report_lines.append("RECOMMENDATIONS:")
-        recommendations = bias_report.get('recommendations', [])
-        if recommendations:
-            for i, rec in enumerate(recommendations, 1):
-                report_lines.append(f"  {i}. {rec}")
-        else:
-            report_lines.append("  1. Focus on job-relevant qualifications")
-            report_lines.append("  2. Use standardized evaluation criteria")
-            report_lines.append("  3. Avoid demographic-based assumptions")
-            report_lines.append("  4. Implement structured interview processes")
+        # Compute each metric once and hand hashable snapshots to the cached builder
+        bias_alert_level, _ = self.calculate_bias_alert_level()
+        completeness = self.calculate_interview_completeness()
+        metrics = (
+            self.calculate_skills_match_score(),
+            bias_alert_level,
+            completeness,
+            _overall_fairness_score(bias_alert_level, completeness),
+        )
+        skills_by_cat = st.session_state.candidate_skills_by_cat
+        skills = (tuple(skills_by_cat['technical']), tuple(skills_by_cat['soft'])) if st.session_state.candidate_skills else None
+        bias_types = tuple(
+            tuple(row.bias['bias_types']) if row.bias and row.bias.get('bias_types') else ()
+            for row in st.session_state.qna_rows
+        )
+        answered = st.session_state.answered_count
         
-        report_lines.append("")
-        report_lines.append("=" * 60)
-        report_lines.append("           HIRING THAT SEES SKILLS, NOT DEMOGRAPHICS")
-        report_lines.append("=" * 60)
+        body = _build_fairness_report(
+            st.session_state.interview_data, metrics, st.session_state.current_difficulty,
+            self.calculate_interview_duration(), skills, bias_types,
+            tuple(st.session_state.answer_scores), answered
+        )
         
-        return "\n".join(report_lines)
+        # The timestamp changes every call, so it stays outside the cached body
+        return _REPORT_HEADER.format(
+            rule=_REPORT_RULE, generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        ) + "\n" + body
 
+    @_fragment
     def display_detailed_question_review(self):
         """Display detailed question-by-question review in separate tab"""
         st.markdown(f'<div class="section-header">📋 {self.get_translated_text("detailed_question_review")}</div>', unsafe_allow_html=True)
         
-        for i, (question, answer, bias_report, analysis, follow_up) in enumerate(zip(
-            st.session_state.interview_questions,
-            st.session_state.candidate_answers,
-            st.session_state.bias_reports,
-            st.session_state.answer_analysis,
-            st.session_state.follow_up_questions
-        )):
-            with st.expander(f"Question {i+1}: {question[:80]}...", expanded=False):
-                col1, col2 = st.columns([2, 1])
-                
-                with col1:
-                    st.markdown("**Your Answer:**")
-                    st.info(answer if answer else "No answer provided")
-                    
-                    if analysis and analysis.get('success'):
-                        st.markdown("**🤖 AI Analysis:**")
-                        st.write(f"**Quality Score:** {analysis.get('quality_score', 'N/A')}/10")
-                        st.write(f"**Relevance:** {analysis.get('relevance_score', 'N/A')}/10")
-                        
-                        if analysis.get('strengths'):
-                            st.write("**Strengths:**")
-                            for strength in analysis['strengths']:
-                                st.write(f"✅ {strength}")
+        show_follow_ups = st.session_state.ai_enabled and self.ai_enhancer.available
+        
+        for i, row in enumerate(st.session_state.qna_rows):
+            with st.expander(f"Question {i+1}: {row.question[:80]}...", expanded=False):
+                # Collapsed expanders are still serialized, so only render the body on request
+                if st.toggle("Show details", key=f"review_open_{i}"):
+                    self._render_question_review(row, show_follow_ups)
+    
+    def _render_question_review(self, row, show_follow_ups):
+        """Render one question's answer, AI analysis, bias result and follow-up"""
+        answer, bias_report, analysis, follow_up = row.answer, row.bias, row.analysis, row.follow_up
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            st.markdown("**Your Answer:**")
+            st.info(answer if answer else "No answer provided")
+            
+            if analysis and analysis.get('success'):
+                st.markdown("**🤖 AI Analysis:**")
+                st.write(f"**Quality Score:** {analysis.get('quality_score', 'N/A')}/10")
+                st.write(f"**Relevance:** {analysis.get('relevance_score', 'N/A')}/10")
                 
-                with col2:
-                    st.markdown("**Bias Analysis:**")
-                    if bias_report:
-                        severity = bias_report['severity']
-                        if severity == 'High':
-                            st.error(f"🟥 High Bias")
-                            if bias_report['bias_types']:
-                                st.write(f"Detected: {', '.join(bias_report['bias_types'])}")
-                        elif severity == 'Medium':
-                            st.warning(f"🟨 Medium Bias")
-                            if bias_report['bias_types']:
-                                st.write(f"Detected: {', '.join(bias_report['bias_types'])}")
-                        elif severity == 'Low':
-                            st.info(f"🟦 Low Bias")
-                        else:
-                            st.success(f"🟩 No Bias Detected")
-                    else:
-                        st.info("No bias analysis available")
-                    
-                    if (follow_up and follow_up.get('success') and 
-                        st.session_state.ai_enabled and self.ai_enhancer.available):
-                        st.markdown("**🤖 Suggested Follow-up:**")
-                        st.info(follow_up.get('follow_up_question', ''))
+                if analysis.get('strengths'):
+                    st.write("**Strengths:**")
+                    for strength in analysis['strengths']:
+                        st.write(f"✅ {strength}")
+        
+        with col2:
+            st.markdown("**Bias Analysis:**")
+            if bias_report:
+                severity = bias_report['severity']
+                if severity == 'High':
+                    st.error(f"🟥 High Bias")
+                    if bias_report['bias_types']:
+                        st.write(f"Detected: {', '.join(bias_report['bias_types'])}")
+                elif severity == 'Medium':
+                    st.warning(f"🟨 Medium Bias")
+                    if bias_report['bias_types']:
+                        st.write(f"Detected: {', '.join(bias_report['bias_types'])}")
+                elif severity == 'Low':
+                    st.info(f"🟦 Low Bias")
+                else:
+                    st.success(f"🟩 No Bias Detected")
+            else:
+                st.info("No bias analysis available")
+            
+            if follow_up and follow_up.get('success') and show_follow_ups:
+                st.markdown("**🤖 Suggested Follow-up:**")
+                st.info(follow_up.get('follow_up_question', ''))
     
     def run(self):
         """Main application runner"""
+        _t = self.get_translated_text
         self.initialize_session_state()
         self.display_header()
         
         # Create tabs for different sections - UPDATED to include Recruiter Dashboard
         if st.session_state.interview_completed:
             tab1, tab2, tab3, tab4 = st.tabs([
-                f"📊 {self.get_translated_text('fairness_dashboard')}",
-                f"👔 {self.get_translated_text('recruiter_dashboard')}",
-                f"🕸️ {self.get_translated_text('skills_visualization')}",
-                f"🎤 {self.get_translated_text('interview_review')}"
+                f"📊 {_t('fairness_dashboard')}",
+                f"👔 {_t('recruiter_dashboard')}",
+                f"🕸️ {_t('skills_visualization')}",
+                f"🎤 {_t('interview_review')}"
             ])
         elif st.session_state.resume_analyzed:
             tab1, tab2, tab3, tab4 = st.tabs([
-                f"🎤 {self.get_translated_text('interview')}",
-                f"🕸️ {self.get_translated_text('skills_visualization')}",
-                f"📊 {self.get_translated_text('dashboard_preview')}",
-                f"👔 {self.get_translated_text('recruiter_view')}"
+                f"🎤 {_t('interview')}",
+                f"🕸️ {_t('skills_visualization')}",
+                f"📊 {_t('dashboard_preview')}",
+                f"👔 {_t('recruiter_view')}"
             ])
         else:
             tab1, tab2, tab3, tab4 = st.tabs([
-                f"🎤 {self.get_translated_text('interview')}",
-                f"🕸️ {self.get_translated_text('skills_visualization')}",
-                f"📊 {self.get_translated_text('dashboard_preview')}",
-                f"👔 {self.get_translated_text('recruiter_view')}"
+                f"🎤 {_t('interview')}",
+                f"🕸️ {_t('skills_visualization')}",
+                f"📊 {_t('dashboard_preview')}",
+                f"👔 {_t('recruiter_view')}"
             ])
         
         with tab1:
@@ -2564,6 +2797,10 @@ Skills: Python, React, SQL, Teamwork, Communication""",
                     self.display_skills()
                     self.interview_section()
                 else:
+                    if st.session_state.completion_notice:
+                        st.session_state.completion_notice = False
+                        st.balloons()
+                        st.success("🎊 Interview completed! Check the summary tab.")
                     self.display_fairness_dashboard()
         
         with tab2:
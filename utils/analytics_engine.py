@@ -64,33 +64,39 @@ class AnalyticsEngine:
         if not answers_data:
             return {}
         
-        coherence_scores = []
+        # Per-answer text features - each answer is split into words once
+        n = len(answers_data)
+        answer_lengths = np.empty(n)
+        unique_word_counts = np.empty(n)
+        sentence_counts = np.empty(n)
+        has_text = np.empty(n, dtype=bool)
         response_times = []
-        answer_lengths = []
         confidence_indicators = []
         
-        for answer in answers_data:
-            # Answer coherence (based on length, structure, completeness)
-            coherence = self._calculate_coherence(answer.get('text', ''))
-            coherence_scores.append(coherence)
+        for i, answer in enumerate(answers_data):
+            text = answer.get('text', '')
+            words = text.split()
+            answer_lengths[i] = len(words)
+            unique_word_counts[i] = len(set(words))
+            sentence_counts[i] = text.count('.') + 1
+            has_text[i] = bool(text)
             
             # Response time analysis
-            response_time = answer.get('response_time', 0)
-            response_times.append(response_time)
-            
-            # Answer length analysis
-            answer_length = len(answer.get('text', '').split())
-            answer_lengths.append(answer_length)
+            response_times.append(answer.get('response_time', 0))
             
             # Confidence indicators (based on language patterns)
-            confidence = self._assess_confidence(answer.get('text', ''))
-            confidence_indicators.append(confidence)
+            confidence_indicators.append(self._assess_confidence(text))
+        
+        # Answer coherence (based on length, structure, completeness), scored for all answers at once
+        coherence_scores = self._coherence_scores(
+            answer_lengths, unique_word_counts, sentence_counts, has_text
+        ).tolist()
         
         # Calculate metrics
-        avg_coherence = np.mean(coherence_scores) if coherence_scores else 0
-        avg_response_time = np.mean(response_times) if response_times else 0
-        avg_answer_length = np.mean(answer_lengths) if answer_lengths else 0
-        avg_confidence = np.mean(confidence_indicators) if confidence_indicators else 0
+        avg_coherence = np.mean(coherence_scores)
+        avg_response_time = np.mean(response_times)
+        avg_answer_length = np.mean(answer_lengths)
+        avg_confidence = np.mean(confidence_indicators)
         
         # Communication style classification
         communication_style = self._classify_communication_style(
@@ -203,24 +209,20 @@ class AnalyticsEngine:
         
         return comparison
     
-    def _calculate_coherence(self, text: str) -> float:
-        """Calculate answer coherence score"""
-        if not text:
-            return 0
-        
-        words = text.split()
-        sentences = text.split('.')
-        
-        # Simple coherence metrics
-        avg_sentence_length = len(words) / len(sentences) if sentences else 0
-        unique_word_ratio = len(set(words)) / len(words) if words else 0
+    def _coherence_scores(self, word_counts: np.ndarray, unique_word_counts: np.ndarray,
+                          sentence_counts: np.ndarray, has_text: np.ndarray) -> np.ndarray:
+        """Calculate answer coherence scores for arrays of per-answer counts"""
+        # Simple coherence metrics (every answer has at least one sentence)
+        avg_sentence_length = word_counts / sentence_counts
+        unique_word_ratio = np.divide(unique_word_counts, word_counts,
+                                      out=np.zeros_like(word_counts), where=word_counts > 0)
         
         # Score based on structure (simplified)
-        score = min(avg_sentence_length / 20 * 40, 40)  # Sentence length factor
-        score += min(unique_word_ratio * 30, 30)  # Vocabulary diversity
-        score += 30 if len(sentences) >= 2 else 0  # Multi-sentence bonus
+        score = np.minimum(avg_sentence_length / 20 * 40, 40)  # Sentence length factor
+        score += np.minimum(unique_word_ratio * 30, 30)  # Vocabulary diversity
+        score += np.where(sentence_counts >= 2, 30, 0)  # Multi-sentence bonus
         
-        return min(score, 100)
+        return np.where(has_text, np.minimum(score, 100), 0)
     
     def _assess_confidence(self, text: str) -> float:
         """Assess confidence level from text"""
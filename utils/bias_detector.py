@@ -1,6 +1,12 @@
 import re
 from typing import List, Dict, Tuple, Any, Set
 from collections import defaultdict
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def _word_pattern(keyword: str) -> "re.Pattern":
+    """Compiled whole-word pattern for a keyword (compiled once, shared by all detectors)"""
+    return re.compile(r'\b' + re.escape(keyword) + r'\b')
 
 class BiasDetector:
     def __init__(self):
@@ -239,11 +245,22 @@ class BiasDetector:
         bias_types_found = set()
         fairness_scores = []
         question_analyses = []
+        # Fairness bands, counted in the same pass as the analysis
+        fair_count = moderate_count = biased_count = excellent_count = 0
         
         # Analyze each question
         for i, question in enumerate(questions):
             question_analysis = self.analyze_question_fairness(question)
-            fairness_scores.append(question_analysis['fairness_score'])
+            score = question_analysis['fairness_score']
+            fairness_scores.append(score)
+            if score >= 7:
+                fair_count += 1
+                if score >= 9:
+                    excellent_count += 1
+            elif score >= 5:
+                moderate_count += 1
+            else:
+                biased_count += 1
             question_analyses.append({
                 'question_number': i + 1,
                 'question': question,
@@ -270,10 +287,10 @@ class BiasDetector:
             'detailed_metrics': {
                 'average_fairness_per_question': round(avg_fairness, 2),
                 'bias_density': round(total_bias_count / total_questions, 2),
-                'fair_questions_count': len([score for score in fairness_scores if score >= 7]),
-                'moderate_questions_count': len([score for score in fairness_scores if 5 <= score < 7]),
-                'biased_questions_count': len([score for score in fairness_scores if score < 5]),
-                'excellent_questions_count': len([score for score in fairness_scores if score >= 9])
+                'fair_questions_count': fair_count,
+                'moderate_questions_count': moderate_count,
+                'biased_questions_count': biased_count,
+                'excellent_questions_count': excellent_count
             },
             'question_by_question_analysis': question_analyses
         }
@@ -644,8 +661,7 @@ class BiasDetector:
 
     def _find_keyword_with_context(self, keyword: str, text: str) -> List[str]:
         """Find keywords with context awareness"""
-        pattern = r'\b' + re.escape(keyword) + r'\b'
-        matches = re.findall(pattern, text)
+        matches = _word_pattern(keyword).findall(text)
         
         # Filter out context exceptions
         filtered_matches = []
@@ -801,8 +817,7 @@ class BiasDetector:
 
     def _exact_match(self, keyword: str, text: str) -> bool:
         """Check for exact word match using regex"""
-        pattern = r'\b' + re.escape(keyword) + r'\b'
-        return bool(re.search(pattern, text))
+        return bool(_word_pattern(keyword).search(text))
 
     def _get_comprehensive_recommendations(self, bias_types: set, total_bias: int, avg_fairness: float) -> List[str]:
         """Generate comprehensive recommendations"""
@@ -872,6 +887,26 @@ def analyze_question_fairness(question: str) -> Dict[str, Any]:
     detector = BiasDetector()
     return detector.analyze_question_fairness(question)
 
+@lru_cache(maxsize=None)
+def _shared_detector() -> BiasDetector:
+    """One detector for the memoized helpers below (built on first use)"""
+    return BiasDetector()
+
+@lru_cache(maxsize=2048)
+def question_fairness_verdict(question: str) -> Tuple[str, str]:
+    """
+    (risk_level, suggestion) for an interview question, memoized per process
+    
+    Generated questions repeat across interviews and sessions, so each distinct
+    question is analysed once. This module is imported once, unlike the app script,
+    which Streamlit re-executes on every rerun.
+    """
+    result = _shared_detector().analyze_question_fairness(question)
+    return (
+        result.get('risk_level', 'Low'),
+        result.get('suggestion', 'Consider rephrasing this question')
+    )
+
 def generate_bias_report(interview_data: Dict[str, Any]) -> Dict[str, Any]:
     """Convenience function to generate bias report"""
     detector = BiasDetector()
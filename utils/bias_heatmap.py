@@ -1,5 +1,4 @@
 import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime
 
 class BiasHeatmapGenerator:
@@ -14,7 +13,7 @@ class BiasHeatmapGenerator:
     
     def generate_real_time_heatmap(self, interview_data):
         """Generate real-time bias heatmap across questions and categories"""
-        if not interview_data or not interview_data.get('bias_analysis'):
+        if not interview_data or not any(interview_data.get('bias_analysis') or ()):
             return self._create_empty_heatmap()
         
         # Prepare data for heatmap
@@ -1,7 +1,7 @@
 import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime
 import pandas as pd
+import numpy as np
 
 class HeatmapGenerator:
     def __init__(self):  # FIXED: Changed from _init_ to __init__
@@ -15,34 +15,25 @@ class HeatmapGenerator:
     
     def generate_bias_heatmap(self, interview_data: dict) -> go.Figure:
         """Generate a comprehensive bias heatmap across questions and categories"""
-        if not interview_data or not interview_data.get('bias_analysis'):
+        if not interview_data or not any(interview_data.get('bias_analysis') or ()):
             return self._create_empty_heatmap("No bias data available yet")
         
         questions = [f"Q{i+1}" for i in range(len(interview_data['questions']))]
         categories = self.bias_categories
         
-        # Create severity matrix
-        severity_matrix = []
-        annotation_matrix = []
+        # Create severity matrix (also used as the hover text)
+        severity_matrix = [
+            [self._get_category_severity(bias_report, category) for category in categories]
+            for bias_report in interview_data['bias_analysis']
+        ]
         
-        for i, bias_report in enumerate(interview_data['bias_analysis']):
-            question_severities = []
-            question_annotations = []
-            
-            for category in categories:
-                severity = self._get_category_severity(bias_report, category)
-                question_severities.append(severity)
-                question_annotations.append(severity)
-            
-            severity_matrix.append(question_severities)
-            annotation_matrix.append(question_annotations)
-        
-        # Convert to numerical values for coloring
+        # Convert to numerical values for coloring - filled straight into one array
         severity_values = {'High': 3, 'Medium': 2, 'Low': 1, 'None': 0}
-        numerical_matrix = []
-        for row in severity_matrix:
-            numerical_row = [severity_values[sev] for sev in row]
-            numerical_matrix.append(numerical_row)
+        numerical_matrix = np.fromiter(
+            (severity_values[sev] for row in severity_matrix for sev in row),
+            dtype=np.int8,
+            count=len(severity_matrix) * len(categories)
+        ).reshape(len(severity_matrix), len(categories))
         
         # Create heatmap - FIXED: removed 'titleside' property
         fig = go.Figure(data=go.Heatmap(
@@ -2,6 +2,7 @@
 from langdetect import detect, DetectorFactory
 from langdetect.lang_detect_exception import LangDetectException
 import re
+from functools import lru_cache
 from typing import Dict, List, Optional
 import aiohttp
 import asyncio
@@ -9,6 +10,51 @@ import asyncio
 # Ensure consistent results
 DetectorFactory.seed = 0
 
+# Simple translation mapping for common question patterns
+_QUESTION_TRANSLATIONS = {
+    'English': {
+        'Tell me about yourself': 'Tell me about yourself',
+        'What are your strengths': 'What are your strengths',
+        'Describe a challenging project': 'Describe a challenging project',
+        'How do you handle teamwork': 'How do you handle teamwork',
+        'Where do you see yourself in 5 years': 'Where do you see yourself in 5 years'
+    },
+    'Spanish': {
+        'Tell me about yourself': 'Háblame de ti mismo',
+        'What are your strengths': '¿Cuáles son tus fortalezas?',
+        'Describe a challenging project': 'Describe un proyecto desafiante',
+        'How do you handle teamwork': '¿Cómo manejas el trabajo en equipo?',
+        'Where do you see yourself in 5 years': '¿Dónde te ves en 5 años?'
+    },
+    'French': {
+        'Tell me about yourself': 'Parlez-moi de vous',
+        'What are your strengths': 'Quelles sont vos forces?',
+        'Describe a challenging project': 'Décrivez un projet difficile',
+        'How do you handle teamwork': 'Comment gérez-vous le travail d\'équipe?',
+        'Where do you see yourself in 5 years': 'Où vous voyez-vous dans 5 ans?'
+    },
+    'Telugu': {
+        'Tell me about yourself': 'మీ గురించి చెప్పండి',
+        'What are your strengths': 'మీ బలాలు ఏమిటి?',
+        'Describe a challenging project': 'సవాలుగా ఉన్న ప్రాజెక్ట్‌ను వివరించండి',
+        'How do you handle teamwork': 'టీమ్‌వర్క్‌ను ఎలా నిర్వహిస్తారు?',
+        'Where do you see yourself in 5 years': '5 సంవత్సరాలలో మిమ్మల్ని ఎక్కడ చూస్తారు?'
+    },
+    'Hindi': {
+        'Tell me about yourself': 'अपने बारे में बताएं',
+        'What are your strengths': 'आपकी ताकत क्या हैं?',
+        'Describe a challenging project': 'एक चुनौतीपूर्ण परियोजना का वर्णन करें',
+        'How do you handle teamwork': 'आप टीमवर्क को कैसे संभालते हैं?',
+        'Where do you see yourself in 5 years': '5 साल में खुद को कहां देखते हैं?'
+    }
+}
+
+# Lowercased English patterns per language, so adaptation does not rebuild or re-lower the table per call
+_QUESTION_PATTERNS = {
+    language: tuple((eng_question.lower(), trans_question) for eng_question, trans_question in translations.items())
+    for language, translations in _QUESTION_TRANSLATIONS.items()
+}
+
 class LanguageSupport:
     def __init__(self):
         self.supported_languages = ['English', 'Spanish', 'French', 'Telugu', 'Hindi']
@@ -559,49 +605,10 @@ class LanguageSupport:
         if target_language == original_language:
             return question
             
-        # Simple translation mapping for common question patterns
-        question_translations = {
-            'English': {
-                'Tell me about yourself': 'Tell me about yourself',
-                'What are your strengths': 'What are your strengths',
-                'Describe a challenging project': 'Describe a challenging project',
-                'How do you handle teamwork': 'How do you handle teamwork',
-                'Where do you see yourself in 5 years': 'Where do you see yourself in 5 years'
-            },
-            'Spanish': {
-                'Tell me about yourself': 'Háblame de ti mismo',
-                'What are your strengths': '¿Cuáles son tus fortalezas?',
-                'Describe a challenging project': 'Describe un proyecto desafiante',
-                'How do you handle teamwork': '¿Cómo manejas el trabajo en equipo?',
-                'Where do you see yourself in 5 years': '¿Dónde te ves en 5 años?'
-            },
-            'French': {
-                'Tell me about yourself': 'Parlez-moi de vous',
-                'What are your strengths': 'Quelles sont vos forces?',
-                'Describe a challenging project': 'Décrivez un projet difficile',
-                'How do you handle teamwork': 'Comment gérez-vous le travail d\'équipe?',
-                'Where do you see yourself in 5 years': 'Où vous voyez-vous dans 5 ans?'
-            },
-            'Telugu': {
-                'Tell me about yourself': 'మీ గురించి చెప్పండి',
-                'What are your strengths': 'మీ బలాలు ఏమిటి?',
-                'Describe a challenging project': 'సవాలుగా ఉన్న ప్రాజెక్ట్‌ను వివరించండి',
-                'How do you handle teamwork': 'టీమ్‌వర్క్‌ను ఎలా నిర్వహిస్తారు?',
-                'Where do you see yourself in 5 years': '5 సంవత్సరాలలో మిమ్మల్ని ఎక్కడ చూస్తారు?'
-            },
-            'Hindi': {
-                'Tell me about yourself': 'अपने बारे में बताएं',
-                'What are your strengths': 'आपकी ताकत क्या हैं?',
-                'Describe a challenging project': 'एक चुनौतीपूर्ण परियोजना का वर्णन करें',
-                'How do you handle teamwork': 'आप टीमवर्क को कैसे संभालते हैं?',
-                'Where do you see yourself in 5 years': '5 साल में खुद को कहां देखते हैं?'
-            }
-        }
-        
         # Return translated question if available, otherwise return original
-        translations = question_translations.get(target_language, {})
-        for eng_question, trans_question in translations.items():
-            if eng_question.lower() in question.lower():
+        question_lower = question.lower()
+        for eng_question, trans_question in _QUESTION_PATTERNS.get(target_language, ()):
+            if eng_question in question_lower:
                 return trans_question
                 
         return question  # Return original if no translation found
@@ -618,4 +625,15 @@ class LanguageSupport:
         return term.lower() in technical_terms
 
 # Singleton instance
-language_support = LanguageSupport()
\ No newline at end of file
+language_support = LanguageSupport()
+
+@lru_cache(maxsize=4096)
+def translate_ui_text(text_key: str, target_language: str) -> str:
+    """
+    Memoized language_support.translate_ui_text
+    
+    UI strings are static per (language, key) and a Streamlit rerun looks up dozens
+    of them. The cache lives here because this module is imported once per process,
+    while the app script is re-executed on every rerun.
+    """
+    return language_support.translate_ui_text(text_key, target_language)
@@ -1,5 +1,5 @@
 import re
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Optional
 
 class ResumeParser:
     def __init__(self):
@@ -20,28 +20,37 @@ class ResumeParser:
             'emotional intelligence', 'mentoring', 'project management'
         ]
     
-    def extract_skills(self, text: str) -> List[Tuple[str, str, float]]:
-        """Extract skills from resume text using keyword matching"""
-        text_lower = text.lower()
+    def extract_skills(self, text: str, text_lower: Optional[str] = None) -> List[Tuple[str, str, float]]:
+        """Extract skills from resume text using keyword matching
+        
+        Pass text_lower to reuse a lowercased copy shared with parse_experience.
+        """
+        if text_lower is None:
+            text_lower = text.lower()
+        # The proficiency context is the same for every skill, so check it once
+        context_boost = self._has_proficiency_context(text_lower)
         found_skills = []
         
         # Check technical skills
         for skill in self.technical_skills:
-            if self._exact_match(skill, text_lower):
-                confidence = self._calculate_confidence(skill, text)
+            occurrences = self._count_matches(skill, text_lower)
+            if occurrences:
+                confidence = self._confidence_from_counts(occurrences, context_boost)
                 found_skills.append((skill, 'technical', confidence))
         
         # Check soft skills
         for skill in self.soft_skills:
-            if self._exact_match(skill, text_lower):
-                confidence = self._calculate_confidence(skill, text)
+            occurrences = self._count_matches(skill, text_lower)
+            if occurrences:
+                confidence = self._confidence_from_counts(occurrences, context_boost)
                 found_skills.append((skill, 'soft', confidence))
         
         return found_skills
     
-    def parse_experience(self, text: str) -> str:
+    def parse_experience(self, text: str, text_lower: Optional[str] = None) -> str:
         """Parse experience level from resume text"""
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         
         # Experience patterns
         senior_patterns = [
@@ -90,19 +99,18 @@ class ResumeParser:
         pattern = r'\b' + re.escape(keyword) + r'\b'
         return bool(re.search(pattern, text))
     
-    def _calculate_confidence(self, skill: str, text: str) -> float:
-        """Calculate confidence score for skill detection"""
-        text_lower = text.lower()
-        
-        # Count occurrences
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        occurrences = len(re.findall(pattern, text_lower))
-        
-        # Check context (nearby words that indicate proficiency)
+    def _count_matches(self, keyword: str, text: str) -> int:
+        """Count exact word matches (one regex pass does both detection and counting)"""
+        pattern = r'\b' + re.escape(keyword) + r'\b'
+        return len(re.findall(pattern, text))
+    
+    def _has_proficiency_context(self, text_lower: str) -> bool:
+        """Check context (nearby words that indicate proficiency)"""
         proficiency_indicators = ['proficient', 'skilled', 'experienced', 'expert', 'strong']
-        context_boost = any(indicator in text_lower for indicator in proficiency_indicators)
-        
-        # Base confidence on frequency and context
+        return any(indicator in text_lower for indicator in proficiency_indicators)
+    
+    def _confidence_from_counts(self, occurrences: int, context_boost: bool) -> float:
+        """Base confidence on frequency and context"""
         base_confidence = min(1.0, occurrences * 0.3)
         if context_boost:
             base_confidence = min(1.0, base_confidence + 0.2)
@@ -110,10 +118,13 @@ class ResumeParser:
         return round(base_confidence, 2)
 
 # Utility functions for skills graph (simplified)
-def build_skills_graph(resume_text: str) -> Dict[str, Any]:
-    """Build a simple skills graph from resume text"""
-    parser = ResumeParser()
-    skills = parser.extract_skills(resume_text)
+def build_skills_graph(resume_text: str, skills: Optional[List[Tuple[str, str, float]]] = None) -> Dict[str, Any]:
+    """Build a simple skills graph from resume text
+    
+    Pass skills already returned by ResumeParser.extract_skills to skip re-parsing.
+    """
+    if skills is None:
+        skills = ResumeParser().extract_skills(resume_text)
     
     graph = {}
     for skill, category, confidence in skills:
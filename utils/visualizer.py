@@ -1,10 +1,13 @@
-import plotly.express as px
 import plotly.graph_objects as go
+import numpy as np
 import pandas as pd
 import networkx as nx
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
-def create_skills_network(skills_graph: Dict[str, Any]) -> go.Figure:
+# Node colors by skill category in the network graph
+_CATEGORY_COLORS = {'technical': '#1f77b4', 'soft': '#ff7f0e', 'other': '#2ca02c'}
+
+def create_skills_network(skills_graph: Dict[str, Any], pos: Optional[Dict[str, Any]] = None) -> go.Figure:
     """Create an interactive network visualization of skills and their relationships"""
     try:
         # Handle empty graph
@@ -37,8 +40,10 @@ def create_skills_network(skills_graph: Dict[str, Any]) -> go.Figure:
                 if related_skill in skills_graph:
                     G.add_edge(skill_name, related_skill)
         
-        # Create positions for nodes
-        pos = nx.spring_layout(G, k=1, iterations=50)
+        # Create positions for nodes, unless precomputed ones were passed in. The seed
+        # keeps the picture stable for a given graph; Plotly only draws fixed points
+        if pos is None:
+            pos = nx.spring_layout(G, k=1, iterations=50, seed=42)
         
         # Extract node positions
         node_x = []
@@ -59,8 +64,7 @@ def create_skills_network(skills_graph: Dict[str, Any]) -> go.Figure:
             category = node_attrs.get('category', 'technical')
             
             # Set color based on category
-            color_map = {'technical': '#1f77b4', 'soft': '#ff7f0e', 'other': '#2ca02c'}
-            node_color.append(color_map.get(category, '#7f7f7f'))
+            node_color.append(_CATEGORY_COLORS.get(category, '#7f7f7f'))
             
             # Set size based on confidence
             node_size.append(15 + (confidence * 25))
@@ -122,7 +126,8 @@ def create_skills_network(skills_graph: Dict[str, Any]) -> go.Figure:
 
 def create_simple_skills_chart(skills_graph: Dict[str, Any]) -> go.Figure:
     """Create a simple skills visualization that handles both objects and dictionaries"""
-    skills_data = []
+    # Column lists, so the DataFrame is built without transposing per-row dicts
+    skill_col, confidence_col, category_col, frequency_col = [], [], [], []
     
     for skill_name, skill_node in skills_graph.items():
         # Handle both object and dictionary formats
@@ -142,20 +147,24 @@ def create_simple_skills_chart(skills_graph: Dict[str, Any]) -> go.Figure:
             category = 'technical'
             frequency = 1
             
-        skills_data.append({
-            'Skill': skill_name,
-            'Confidence': confidence,
-            'Category': category,
-            'Frequency': frequency
-        })
+        skill_col.append(skill_name)
+        confidence_col.append(confidence)
+        category_col.append(category)
+        frequency_col.append(frequency)
     
-    if not skills_data:
+    if not skill_col:
         # Create empty figure if no data
         return create_fallback_chart("No skills data available")
     
-    df = pd.DataFrame(skills_data)
+    df = pd.DataFrame({
+        'Skill': skill_col,
+        'Confidence': confidence_col,
+        'Category': category_col,
+        'Frequency': frequency_col
+    })
     
-    # Create bar chart
+    # Create bar chart (plotly.express is only needed here, so import it lazily)
+    import plotly.express as px
     fig = px.bar(df, x='Skill', y='Confidence', color='Category',
                  title="Skills Confidence Levels",
                  color_discrete_map={'technical': '#1f77b4', 'soft': '#ff7f0e'})
@@ -245,59 +254,38 @@ def create_category_barchart(skills_by_category: Dict[str, list]) -> go.Figure:
         print(f"Error creating category barchart: {e}")
         return create_fallback_chart("Category chart not available")
 
+def _confidence_and_category(skill_node) -> tuple:
+    """(confidence, category) of a skills-graph node in either object or dictionary format"""
+    if hasattr(skill_node, 'confidence'):
+        return skill_node.confidence, skill_node.category
+    if isinstance(skill_node, dict):
+        return skill_node.get('confidence', 0.5), skill_node.get('category', 'technical')
+    return 0.5, 'technical'
+
 def create_confidence_heatmap(skills_graph: Dict[str, Any]) -> go.Figure:
     """Create a heatmap showing skill confidence levels"""
     try:
         if not skills_graph:
             return create_fallback_chart("No skills data available")
             
-        # Prepare data for heatmap
-        skills_list = []
-        categories_list = []
-        confidence_list = []
-        
-        for skill_name, skill_node in skills_graph.items():
-            # Handle both object and dictionary formats
-            if hasattr(skill_node, 'confidence'):
-                confidence = skill_node.confidence
-                category = skill_node.category
-            elif isinstance(skill_node, dict):
-                confidence = skill_node.get('confidence', 0.5)
-                category = skill_node.get('category', 'technical')
-            else:
-                confidence = 0.5
-                category = 'technical'
-                
-            skills_list.append(skill_name)
-            categories_list.append(category)
-            confidence_list.append(confidence)
-        
-        # Create a pivot table for heatmap
-        df = pd.DataFrame({
-            'Skill': skills_list,
-            'Category': categories_list,
-            'Confidence': confidence_list
-        })
-        
-        # Group by category and calculate average confidence
-        category_stats = df.groupby('Category').agg({
-            'Confidence': 'mean',
-            'Skill': 'count'
-        }).reset_index()
-        
-        category_stats = category_stats.rename(columns={'Skill': 'Count'})
+        # Per-category average confidence and skill count in one bincount pass
+        fields = [_confidence_and_category(skill_node) for skill_node in skills_graph.values()]
+        confidences = np.fromiter((confidence for confidence, _ in fields), dtype=float, count=len(fields))
+        categories, category_index = np.unique([category for _, category in fields], return_inverse=True)
+        counts = np.bincount(category_index)
+        avg_confidences = np.bincount(category_index, weights=confidences) / counts
         
         # Create heatmap-like visualization
         fig = go.Figure(data=go.Bar(
-            x=category_stats['Category'],
-            y=category_stats['Confidence'],
+            x=categories,
+            y=avg_confidences,
             text=[f"Avg: {conf:.2f}<br>Skills: {count}" 
-                  for conf, count in zip(category_stats['Confidence'], category_stats['Count'])],
+                  for conf, count in zip(avg_confidences, counts)],
             textposition='auto',
-            marker_color=category_stats['Confidence'],
+            marker_color=avg_confidences,
             marker_colorscale='Viridis',
             hovertemplate='<b>%{x}</b><br>Average Confidence: %{y:.2f}<br>Number of Skills: %{customdata}<extra></extra>',
-            customdata=category_stats['Count']
+            customdata=counts
         ))
         
         fig.update_layout(